@@ -19,6 +19,18 @@ import os
 import glob
 
 
+# HSV threshold bounds (built once, not per frame)
+# Bright orange color range (calibrated for your stencil)
+_ORANGE_LO = np.array([5, 150, 150], dtype=np.uint8)
+_ORANGE_HI = np.array([20, 255, 255], dtype=np.uint8)
+# Yellow range (for yellow markings) - from color detection tool
+_YELLOW_LO = np.array([15, 80, 80], dtype=np.uint8)
+_YELLOW_HI = np.array([35, 255, 255], dtype=np.uint8)
+# White range - FROM YOUR TESTING: H:0-180, S:0-199, V:121-254
+_WHITE_LO = np.array([0, 0, 98], dtype=np.uint8)
+_WHITE_HI = np.array([180, 199, 254], dtype=np.uint8)
+
+
 @dataclass
 class AlignmentResult:
     """Simple alignment results"""
@@ -44,16 +56,16 @@ class SimpleYellowAlignmentDetector:
         self.alignment_tolerance = alignment_tolerance
         self.debug = debug
         
-    def detect_orange_stencil(self, image: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
-        """Detect the orange stencil frame - returns (x, y, w, h)"""
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    def detect_orange_stencil(self, image: np.ndarray,
+                              hsv: Optional[np.ndarray] = None) -> Optional[Tuple[int, int, int, int]]:
+        """Detect the orange stencil frame - returns (x, y, w, h)
 
-        # Bright orange color range (calibrated for your stencil)
-        # This matches the bright orange plastic material shown in your image
-        lower_orange = np.array([5, 150, 150])
-        upper_orange = np.array([20, 255, 255])
+        Pass a precomputed HSV version of image to skip the color conversion.
+        """
+        if hsv is None:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
 
-        orange_mask = cv2.inRange(hsv, lower_orange, upper_orange)
+        orange_mask = cv2.inRange(hsv, _ORANGE_LO, _ORANGE_HI)
 
         kernel = np.ones((5, 5), np.uint8)
         orange_mask = cv2.morphologyEx(orange_mask, cv2.MORPH_CLOSE, kernel)
@@ -69,9 +81,11 @@ class SimpleYellowAlignmentDetector:
         
         return (x, y, w, h)
     
-    def detect_yellow_in_zones(self, image: np.ndarray, stencil_bbox: Tuple[int, int, int, int]) -> Tuple[str, float, float]:
+    def detect_yellow_in_zones(self, image: np.ndarray, stencil_bbox: Tuple[int, int, int, int],
+                               hsv: Optional[np.ndarray] = None) -> Tuple[str, float, float]:
         """
         Detect which zone contains yellow pixels
+        Pass a precomputed HSV version of image to skip the color conversion.
         Returns: (zone_name, offset_px, offset_percentage)
         """
         # IGNORE stencil_bbox - use entire image instead
@@ -83,25 +97,17 @@ class SimpleYellowAlignmentDetector:
         roi_w = img_width
         roi_h = img_height  # Full height
 
-        roi = image[roi_y:roi_y+roi_h, roi_x:roi_x+roi_w].copy()
-        
-        # Convert to HSV
-        hsv_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        # Convert to HSV (the ROI is a view - no copy needed, cvtColor only reads it)
+        if hsv is None:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        hsv_roi = hsv[roi_y:roi_y+roi_h, roi_x:roi_x+roi_w]
         
         # Yellow/white color range - USING VALUES FROM COLOR DETECTION TOOL
         # These values were tested and confirmed to work with your setup
         
-        # Yellow range (for yellow markings)
-        lower_yellow = np.array([15, 80, 80])
-        upper_yellow = np.array([35, 255, 255])
-        
-        # White range - FROM YOUR TESTING: H:0-180, S:0-199, V:121-254
-        lower_white = np.array([0, 0, 98])
-        upper_white = np.array([180, 199, 254])
-        
         # Create masks
-        yellow_mask = cv2.inRange(hsv_roi, lower_yellow, upper_yellow)
-        white_mask = cv2.inRange(hsv_roi, lower_white, upper_white)
+        yellow_mask = cv2.inRange(hsv_roi, _YELLOW_LO, _YELLOW_HI)
+        white_mask = cv2.inRange(hsv_roi, _WHITE_LO, _WHITE_HI)
         
         # Combine masks
         marking_mask = cv2.bitwise_or(yellow_mask, white_mask)
@@ -184,8 +190,11 @@ class SimpleYellowAlignmentDetector:
         height, width = image.shape[:2]
         debug_img = image.copy() if self.debug else None
         
+        # Single BGR->HSV conversion shared by stencil and marking detection
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
         # Detect stencil
-        stencil_bbox = self.detect_orange_stencil(image)
+        stencil_bbox = self.detect_orange_stencil(image, hsv)
 
         if stencil_bbox is None:
             return AlignmentResult(
@@ -201,7 +210,7 @@ class SimpleYellowAlignmentDetector:
         stencil_center_x = x + w/2
         
         # Detect yellow in zones
-        zone, offset_px, offset_percent = self.detect_yellow_in_zones(image, stencil_bbox)
+        zone, offset_px, offset_percent = self.detect_yellow_in_zones(image, stencil_bbox, hsv)
         
         # Determine if aligned
         is_aligned = (zone == "CENTER")
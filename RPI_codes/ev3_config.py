@@ -75,6 +75,11 @@ CAMERA_WIDTH = 1920
 CAMERA_HEIGHT = 1080
 CAMERA_FPS = 30
 
+# Alignment analysis resolution
+# Each level halves width and height with cv2.pyrDown before yellow detection
+# (1 = 960x540 from 1080p). Zone/offset results are percentages, so unaffected.
+ALIGNMENT_PYRDOWN_LEVELS = 1
+
 # Camera mounting
 CAMERA_HEIGHT_CM = 30.0  # [NEEDS CALIBRATION] Height of camera above ground (cm)
 CAMERA_ANGLE_DEG = 90.0  # Camera angle (90 = straight down)
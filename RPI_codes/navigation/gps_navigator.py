@@ -5,11 +5,12 @@ GPS Navigator Module
 Handles GPS navigation using MTi sensor and motor controller.
 """
 
+import logging
 import time
 import math
 from typing import Optional, Tuple
 from utils.logger import get_logger
-from utils.geo_utils import haversine_distance, calculate_bearing, bearing_difference, normalize_bearing
+from utils.geo_utils import haversine_distance, haversine_distance_fast, calculate_bearing, bearing_difference, normalize_bearing
 
 logger = get_logger(__name__)
 
@@ -47,7 +48,8 @@ class GPSNavigator:
             if data and data.latitude_longitude:
                 lat, lon = data.latitude_longitude
                 self.last_position = (lat, lon)
-                logger.debug(f"GPS position: {lat:.6f}, {lon:.6f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"GPS position: {lat:.6f}, {lon:.6f}")
                 return (lat, lon)
             else:
                 logger.warning("No GPS data available")
@@ -73,7 +75,8 @@ class GPSNavigator:
                 # Convert yaw to heading (0-360)
                 heading = normalize_bearing(yaw)
                 self.last_heading = heading
-                logger.debug(f"Heading: {heading:.1f}°")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Heading: {heading:.1f}°")
                 return heading
             else:
                 logger.warning("No heading data available")
@@ -152,7 +155,7 @@ class GPSNavigator:
                 continue
 
             # Calculate distance to target
-            distance = haversine_distance(
+            distance = haversine_distance_fast(
                 current_pos[0], current_pos[1],
                 target_lat, target_lon
             )
@@ -180,7 +183,8 @@ class GPSNavigator:
             # Calculate heading error
             heading_error = bearing_difference(current_heading, target_bearing)
 
-            logger.debug(f"Current: {current_heading:.1f}°, Target: {target_bearing:.1f}°, Error: {heading_error:.1f}°")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Current: {current_heading:.1f}°, Target: {target_bearing:.1f}°, Error: {heading_error:.1f}°")
 
             # Adjust heading if needed
             if abs(heading_error) > 10:  # If more than 10 degrees off
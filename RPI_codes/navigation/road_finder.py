@@ -5,12 +5,16 @@ Road Finder Module
 Finds nearest road from GeoJSON data and calculates road bearings.
 """
 
+import gzip
 import json
 import math
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
+import numpy as np
 from utils.logger import get_logger
-from utils.geo_utils import haversine_distance, calculate_bearing, point_to_line_distance, project_point_onto_line
+from utils.geo_utils import (haversine_distance_batch, calculate_bearing,
+                             point_to_line_distance, project_point_onto_line,
+                             project_point_onto_segments)
 
 logger = get_logger(__name__)
 
@@ -33,13 +37,17 @@ class RoadFinder:
         Initialize Road Finder.
 
         Args:
-            geojson_file: Path to GeoJSON file with road data
+            geojson_file: Path to GeoJSON file with road data (or a .npz
+                          array export from download_roads.py)
         """
         self.roads = []
         self.geojson_file = geojson_file
 
         if geojson_file:
-            self.load_geojson(geojson_file)
+            if geojson_file.endswith('.npz'):
+                self.load_npz(geojson_file)
+            else:
+                self.load_geojson(geojson_file)
 
         logger.info(f"Road Finder initialized with {len(self.roads)} roads")
 
@@ -48,14 +56,15 @@ class RoadFinder:
         Load road data from GeoJSON file.
 
         Args:
-            filepath: Path to GeoJSON file
+            filepath: Path to GeoJSON file (.gz files are decompressed)
 
         Returns:
             True if successful, False otherwise
         """
         try:
             logger.info(f"Loading roads from {filepath}")
-            with open(filepath, 'r') as f:
+            opener = gzip.open if filepath.endswith('.gz') else open
+            with opener(filepath, 'rt') as f:
                 data = json.load(f)
 
             if data.get('type') != 'FeatureCollection':
@@ -78,8 +87,13 @@ class RoadFinder:
                 # Convert [lon, lat] to [lat, lon]
                 coords = [(lat, lon) for lon, lat in coordinates]
 
+                # (N-1, 2, 2) array of [start, end] segments for vectorized searches
+                points = np.asarray(coords, dtype=np.float64)
+                segments = np.stack((points[:-1], points[1:]), axis=1)
+
                 self.roads.append({
                     'geometry': coords,
+                    'segments': segments,
                     'properties': feature.get('properties', {})
                 })
 
@@ -96,6 +110,51 @@ class RoadFinder:
             logger.error(f"Error loading GeoJSON: {e}")
             return False
 
+    def load_npz(self, filepath: str) -> bool:
+        """
+        Load road data from the flat-array export of download_roads.py --npz.
+
+        Args:
+            filepath: Path to .npz file (coords, offsets, osm_id, highway, name)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.info(f"Loading roads from {filepath}")
+            with np.load(filepath) as data:
+                coords = data['coords']  # (N, 2) lat, lon
+                offsets = data['offsets']
+                osm_ids = data['osm_id']
+                highways = data['highway']
+                names = data['name']
+
+            self.roads = []
+            for i in range(len(offsets) - 1):
+                points = coords[offsets[i]:offsets[i + 1]]
+                if len(points) < 2:
+                    continue
+
+                self.roads.append({
+                    'geometry': [tuple(p) for p in points.tolist()],
+                    'segments': np.stack((points[:-1], points[1:]), axis=1),
+                    'properties': {
+                        'osm_id': int(osm_ids[i]),
+                        'name': str(names[i]),
+                        'highway': str(highways[i])
+                    }
+                })
+
+            logger.info(f"Loaded {len(self.roads)} roads")
+            return True
+
+        except FileNotFoundError:
+            logger.error(f"Road array file not found: {filepath}")
+            return False
+        except Exception as e:
+            logger.error(f"Error loading road arrays: {e}")
+            return False
+
     def find_nearest_road(self, lat: float, lon: float,
                          max_distance_meters: float = 50.0) -> Optional[RoadSegment]:
         """
@@ -121,30 +180,30 @@ class RoadFinder:
         for road in self.roads:
             coords = road['geometry']
 
-            # Check each segment of the road
-            for i in range(len(coords) - 1):
+            # Project onto every segment of the road at once and take the nearest
+            projected = project_point_onto_segments((lat, lon), road['segments'])
+            distances = haversine_distance_batch(lat, lon, projected[:, 0], projected[:, 1])
+            i = int(np.argmin(distances))
+            distance = float(distances[i])
+
+            if distance < min_distance and distance <= max_distance_meters:
+                min_distance = distance
                 start = coords[i]
                 end = coords[i + 1]
 
-                # Calculate distance to this segment
-                distance = point_to_line_distance((lat, lon), start, end)
+                # Closest point on the nearest segment
+                closest_point = (float(projected[i, 0]), float(projected[i, 1]))
 
-                if distance < min_distance and distance <= max_distance_meters:
-                    min_distance = distance
+                # Calculate bearing of this road segment
+                bearing = calculate_bearing(start[0], start[1], end[0], end[1])
 
-                    # Project point onto this segment
-                    closest_point = project_point_onto_line((lat, lon), start, end)
-
-                    # Calculate bearing of this road segment
-                    bearing = calculate_bearing(start[0], start[1], end[0], end[1])
-
-                    nearest_road = RoadSegment(
-                        geometry=coords,
-                        bearing=bearing,
-                        distance=distance,
-                        closest_point=closest_point,
-                        properties=road['properties']
-                    )
+                nearest_road = RoadSegment(
+                    geometry=coords,
+                    bearing=bearing,
+                    distance=distance,
+                    closest_point=closest_point,
+                    properties=road['properties']
+                )
 
         if nearest_road:
             logger.info(f"Found road at {nearest_road.distance:.2f}m, bearing {nearest_road.bearing:.1f}°")
@@ -225,27 +284,24 @@ class RoadFinder:
         for road in self.roads:
             coords = road['geometry']
 
-            # Check if any point on the road is within radius
-            for coord in coords:
-                distance = haversine_distance(lat, lon, coord[0], coord[1])
-                if distance <= radius_meters:
-                    # Calculate bearing and closest point
-                    for i in range(len(coords) - 1):
-                        start = coords[i]
-                        end = coords[i + 1]
-                        dist = point_to_line_distance((lat, lon), start, end)
-                        closest_point = project_point_onto_line((lat, lon), start, end)
-                        bearing = calculate_bearing(start[0], start[1], end[0], end[1])
-
-                        roads_in_area.append(RoadSegment(
-                            geometry=coords,
-                            bearing=bearing,
-                            distance=dist,
-                            closest_point=closest_point,
-                            properties=road['properties']
-                        ))
-                        break  # Only add road once
-                    break
+            # Check if any point on the road is within radius (all points in one call)
+            points = np.asarray(coords)
+            distances = haversine_distance_batch(lat, lon, points[:, 0], points[:, 1])
+            if np.any(distances <= radius_meters):
+                # Calculate bearing and closest point (first segment)
+                start = coords[0]
+                end = coords[1]
+                dist = point_to_line_distance((lat, lon), start, end)
+                closest_point = project_point_onto_line((lat, lon), start, end)
+                bearing = calculate_bearing(start[0], start[1], end[0], end[1])
+
+                roads_in_area.append(RoadSegment(
+                    geometry=coords,
+                    bearing=bearing,
+                    distance=dist,
+                    closest_point=closest_point,
+                    properties=road['properties']
+                ))
 
         logger.info(f"Found {len(roads_in_area)} roads within {radius_meters}m")
         return roads_in_area
@@ -21,6 +21,8 @@ import numpy as np
 import logging
 import threading
 import time
+import atexit
+from collections import deque
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
@@ -43,6 +45,7 @@ except ImportError:
     CAMERA_INDEX = 0
     CAMERA_WIDTH = 1920
     CAMERA_HEIGHT = 1080
+    ALIGNMENT_PYRDOWN_LEVELS = 1
     PIXELS_PER_CM = 10.0
     POSITION_TOLERANCE_CM = 2.0
     SIMULATION_MODE = False
@@ -85,11 +88,24 @@ class StencilAligner:
         aligner.stop()
     """
 
+    # Opened cameras shared across instances and start/stop cycles, keyed by
+    # device index. Opening a UVC camera can take 10+ s, so stop() only halts
+    # the capture thread; release_cameras() frees the devices (run at exit).
+    # Aligners on the same index share one device, so each index also gets a
+    # read lock that serializes read() calls across their capture threads.
+    _cameras = {}
+    _camera_read_locks = {}
+    _cameras_lock = threading.Lock()
+
+    # Seconds between pipeline metric summaries logged by the capture thread
+    STATS_LOG_INTERVAL = 10.0
+
     def __init__(self,
                  camera_index: int = CAMERA_INDEX,
                  pixels_per_cm: float = PIXELS_PER_CM,
                  tolerance_cm: float = POSITION_TOLERANCE_CM,
-                 simulate: bool = SIMULATION_MODE):
+                 simulate: bool = SIMULATION_MODE,
+                 pyrdown_levels: int = ALIGNMENT_PYRDOWN_LEVELS):
         """
         Initialize stencil aligner.
 
@@ -98,18 +114,36 @@ class StencilAligner:
             pixels_per_cm: Calibration factor for pixel-to-cm conversion
             tolerance_cm: Alignment tolerance (cm)
             simulate: If True, uses test images instead of camera
+            pyrdown_levels: Number of cv2.pyrDown halvings applied before detection
         """
         self.camera_index = camera_index
         self.pixels_per_cm = pixels_per_cm
         self.tolerance_cm = tolerance_cm
         self.simulate = simulate
+        self.pyrdown_levels = max(0, int(pyrdown_levels))
 
         # Camera capture
         self.camera = None
+        self._camera_read_lock = None
         self.capture_thread = None
         self.running = False
         self.frame_lock = threading.Lock()
         self.latest_frame = None
+        # Triple buffer: capture thread fills _back_frame, consumers own _front_frame.
+        # Frames are exchanged by swapping references under frame_lock - no copies.
+        self._back_frame = None
+        self._front_frame = None
+        self._frame_fresh = False
+        self._sim_frame = None  # Decoded once on first use in simulation
+
+        # Pipeline metrics (latency windows are bounded ring buffers, ms)
+        self._stats = {
+            'captured': 0,
+            'dropped': 0,  # Frames overwritten before any consumer took them
+            'analyzed': 0,
+            'capture_latency_ms': deque(maxlen=64),
+            'analysis_latency_ms': deque(maxlen=64),
+        }
 
         # Alignment detector
         if DETECTOR_AVAILABLE:
@@ -132,15 +166,16 @@ class StencilAligner:
             return True
 
         try:
-            # Open camera
-            self.camera = cv2.VideoCapture(self.camera_index)
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+            # Open camera (reused if already open)
+            self.camera = self._open_camera(self.camera_index)
 
-            if not self.camera.isOpened():
+            if self.camera is None:
                 logger.error("Failed to open camera")
                 return False
 
+            with self._cameras_lock:
+                self._camera_read_lock = self._camera_read_locks[self.camera_index]
+
             # Start capture thread
             self.running = True
             self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
@@ -163,16 +198,79 @@ class StencilAligner:
             logger.error(f"Failed to start camera: {e}")
             return False
 
+    @classmethod
+    def _open_camera(cls, camera_index: int) -> Optional[cv2.VideoCapture]:
+        """
+        Get the shared capture device for camera_index, opening it on first use.
+
+        Returns:
+            Opened VideoCapture or None if the camera could not be opened
+        """
+        with cls._cameras_lock:
+            camera = cls._cameras.get(camera_index)
+            if camera is not None and camera.isOpened():
+                return camera
+
+            camera = cv2.VideoCapture(camera_index)
+            camera.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
+            camera.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+
+            if not camera.isOpened():
+                camera.release()
+                return None
+
+            cls._cameras[camera_index] = camera
+            cls._camera_read_locks.setdefault(camera_index, threading.Lock())
+            logger.info(f"Camera {camera_index} opened")
+            return camera
+
+    @classmethod
+    def release_cameras(cls):
+        """Release all shared capture devices"""
+        with cls._cameras_lock:
+            for camera_index, camera in cls._cameras.items():
+                # Wait out any read in progress on this device
+                with cls._camera_read_locks[camera_index]:
+                    camera.release()
+            cls._cameras.clear()
+
     def _capture_loop(self):
         """Background thread for continuous camera capture"""
         logger.info("Camera capture thread started")
 
+        stats = self._stats
+        window_start = time.monotonic()
+        window_captured = stats['captured']
+
         while self.running:
             try:
-                ret, frame = self.camera.read()
+                # Decode into the spare buffer, then publish it by swapping
+                t0 = time.monotonic()
+                # Shared device: one read() at a time per camera index
+                with self._camera_read_lock:
+                    ret, frame = self.camera.read(self._back_frame)
+                now = time.monotonic()
                 if ret:
                     with self.frame_lock:
+                        if self._frame_fresh:
+                            stats['dropped'] += 1
+                        self._back_frame = self.latest_frame
                         self.latest_frame = frame
+                        self._frame_fresh = True
+                    stats['captured'] += 1
+                    stats['capture_latency_ms'].append((now - t0) * 1000.0)
+
+                    # Periodic one-line summary
+                    if now - window_start >= self.STATS_LOG_INTERVAL:
+                        fps = (stats['captured'] - window_captured) / (now - window_start)
+                        snapshot = self.get_stats()
+                        logger.info(
+                            f"Camera stats: {fps:.1f} fps, captured={snapshot['captured']}, "
+                            f"dropped={snapshot['dropped']}, analyzed={snapshot['analyzed']}, "
+                            f"capture={snapshot['capture_latency_ms']:.1f}ms, "
+                            f"analysis={snapshot['analysis_latency_ms']:.1f}ms")
+                        window_start = now
+                        window_captured = stats['captured']
                 else:
                     logger.warning("Failed to capture frame")
                     time.sleep(0.1)
@@ -183,24 +281,50 @@ class StencilAligner:
 
         logger.info("Camera capture thread stopped")
 
+    def get_stats(self) -> dict:
+        """
+        Get a snapshot of the capture/analysis pipeline metrics.
+
+        Returns:
+            Dictionary with frame counters and mean latencies (ms)
+        """
+        stats = self._stats
+        capture = list(stats['capture_latency_ms'])
+        analysis = list(stats['analysis_latency_ms'])
+        return {
+            'captured': stats['captured'],
+            'dropped': stats['dropped'],
+            'analyzed': stats['analyzed'],
+            'capture_latency_ms': sum(capture) / len(capture) if capture else 0.0,
+            'analysis_latency_ms': sum(analysis) / len(analysis) if analysis else 0.0,
+        }
+
     def get_latest_frame(self) -> Optional[np.ndarray]:
         """
         Get the most recent camera frame.
 
+        The returned array is not copied: it belongs to the caller until the
+        next call, after which the capture thread may reuse it. Copy it if it
+        must outlive that or will be drawn on.
+
         Returns:
             Latest frame or None if not available
         """
         if self.simulate:
-            # In simulation, try to load a test image
-            test_image_path = os.path.join(os.path.dirname(__file__), 'cam', 'datas', 'test_image.jpg')
-            if os.path.exists(test_image_path):
-                return cv2.imread(test_image_path)
-            else:
-                # Create a blank test image
-                return np.zeros((CAMERA_HEIGHT, CAMERA_WIDTH, 3), dtype=np.uint8)
+            if self._sim_frame is None:
+                # In simulation, try to load a test image
+                test_image_path = os.path.join(os.path.dirname(__file__), 'cam', 'datas', 'test_image.jpg')
+                self._sim_frame = cv2.imread(test_image_path)
+                if self._sim_frame is None:
+                    # Create a blank test image
+                    self._sim_frame = np.zeros((CAMERA_HEIGHT, CAMERA_WIDTH, 3), dtype=np.uint8)
+            return self._sim_frame
 
         with self.frame_lock:
-            return self.latest_frame.copy() if self.latest_frame is not None else None
+            if self._frame_fresh:
+                self._front_frame, self.latest_frame = self.latest_frame, self._front_frame
+                self._frame_fresh = False
+            return self._front_frame
 
     def get_alignment_instruction(self) -> AlignmentInstruction:
         """
@@ -233,8 +357,16 @@ class StencilAligner:
             )
 
         try:
+            # Downsample before detection - zones and offset_percentage are
+            # resolution independent, so the result needs no rescaling
+            for _ in range(self.pyrdown_levels):
+                frame = cv2.pyrDown(frame)
+
             # Run alignment detection
+            t0 = time.monotonic()
             result = self.detector.analyze_alignment(frame)
+            self._stats['analysis_latency_ms'].append((time.monotonic() - t0) * 1000.0)
+            self._stats['analyzed'] += 1
 
             # Convert to physical instruction
             instruction = self._result_to_instruction(result)
@@ -332,7 +464,11 @@ class StencilAligner:
         try:
             instruction = self.get_alignment_instruction()
             if instruction.debug_image is not None:
-                cv2.imwrite(filepath, instruction.debug_image)
+                # Debug image is rendered on the downsampled frame - upscale on save
+                debug_image = instruction.debug_image
+                for _ in range(self.pyrdown_levels):
+                    debug_image = cv2.pyrUp(debug_image)
+                cv2.imwrite(filepath, debug_image)
                 logger.info(f"Debug image saved: {filepath}")
                 return True
             else:
@@ -356,6 +492,7 @@ class StencilAligner:
         if frame is None:
             logger.error("No frame available for calibration")
             return None
+        frame = frame.copy()  # Drawn on below
 
         # Show frame and let user click two points
         logger.info(f"Click two points {known_distance_cm}cm apart")
@@ -395,7 +532,12 @@ class StencilAligner:
         return pixels_per_cm
 
     def stop(self):
-        """Stop camera capture and cleanup"""
+        """
+        Stop camera capture and cleanup.
+
+        The camera device stays open for the next start(); call
+        StencilAligner.release_cameras() to free it.
+        """
         logger.info("Stopping stencil aligner...")
 
         self.running = False
@@ -403,8 +545,12 @@ class StencilAligner:
         if self.capture_thread:
             self.capture_thread.join(timeout=2.0)
 
-        if self.camera:
-            self.camera.release()
+        # Drop frames so the next start() waits for a fresh one
+        with self.frame_lock:
+            self.latest_frame = None
+            self._back_frame = None
+            self._front_frame = None
+            self._frame_fresh = False
 
         cv2.destroyAllWindows()
 
@@ -420,6 +566,9 @@ class StencilAligner:
         self.stop()
 
 
+atexit.register(StencilAligner.release_cameras)
+
+
 # ============================================================================
 # TEST CODE
 # ============================================================================
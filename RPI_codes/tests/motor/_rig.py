@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Shared L298N motor rig for the lgpio test scripts.
+
+Opens gpiochip4, claims the six motor pins and starts hardware-timed PWM.
+Nested (or concurrent) `with motor_rig()` blocks share the same handle, so the
+pins are never claimed twice ("resource busy"). The chip is closed when the
+outermost block exits; a later block opens and claims it again.
+"""
+
+import threading
+from contextlib import contextmanager
+
+import lgpio
+
+# Motor pins
+L_PWM, L_D1, L_D2 = 12, 16, 20  # Left motor
+R_PWM, R_D1, R_D2 = 13, 19, 26  # Right motor
+
+PWM_FREQ = 1000  # 1kHz frequency
+
+# (DIR1, DIR2) levels for each direction
+DIRECTIONS = {
+    'forward': (1, 0),
+    'reverse': (0, 1),
+    'stop': (0, 0),
+}
+
+PINS = {
+    'left': (L_PWM, L_D1, L_D2),
+    'right': (R_PWM, R_D1, R_D2),
+}
+
+
+class Rig:
+    """Claimed motor pins on an open gpiochip handle"""
+
+    def __init__(self, handle):
+        self.handle = handle
+
+    def set(self, motor, direction, speed):
+        """
+        Control motor speed and direction
+
+        Args:
+            motor: 'left' or 'right'
+            direction: 'forward', 'reverse', or 'stop'
+            speed: 0-100 (percentage)
+        """
+        pwm, d1, d2 = PINS[motor]
+        v1, v2 = DIRECTIONS[direction]
+        if direction == 'stop':
+            speed = 0
+        speed = max(0, min(100, speed))  # Clamp between 0-100
+
+        lgpio.gpio_write(self.handle, d1, v1)
+        lgpio.gpio_write(self.handle, d2, v2)
+        lgpio.tx_pwm(self.handle, pwm, PWM_FREQ, speed)
+
+    def stop(self):
+        """Stop both motors"""
+        self.set('left', 'stop', 0)
+        self.set('right', 'stop', 0)
+
+
+_lock = threading.Lock()
+_rig = None
+_users = 0
+
+
+@contextmanager
+def motor_rig(chip=4):
+    """
+    Open the motor rig (or reuse the one already open) and stop the
+    motors on exit. The chip is closed when the last user leaves.
+
+    Args:
+        chip: gpiochip number (4 on Raspberry Pi 5)
+
+    Returns:
+        Rig with set(motor, direction, speed) and stop()
+    """
+    global _rig, _users
+
+    with _lock:
+        if _rig is None:
+            h = lgpio.gpiochip_open(chip)
+            # tx_pwm needs the PWM pins claimed as outputs too
+            for pin in (L_PWM, L_D1, L_D2, R_PWM, R_D1, R_D2):
+                lgpio.gpio_claim_output(h, pin)
+            lgpio.tx_pwm(h, L_PWM, PWM_FREQ, 0)  # Start at 0% duty cycle
+            lgpio.tx_pwm(h, R_PWM, PWM_FREQ, 0)
+            _rig = Rig(h)
+        _users += 1
+        rig = _rig
+
+    try:
+        yield rig
+    finally:
+        with _lock:
+            rig.stop()
+            _users -= 1
+            if _users == 0:
+                lgpio.gpiochip_close(rig.handle)
+                _rig = None
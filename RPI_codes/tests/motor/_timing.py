@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Shared timing helpers for the motor controller scripts.
+
+sleep_until_ns() sleeps to an absolute deadline via
+clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME). Unlike chained relative
+sleeps, oversleeping one PWM edge doesn't push back the next. Falls back to
+time.sleep() where libc's clock_nanosleep isn't available.
+"""
+
+import time
+import ctypes
+import ctypes.util
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+_TIMER_ABSTIME = 1
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    _clock_nanosleep = _libc.clock_nanosleep
+    _clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int,
+                                 ctypes.POINTER(_Timespec), ctypes.c_void_p]
+    _CLOCK_MONOTONIC = time.CLOCK_MONOTONIC
+except (OSError, AttributeError, TypeError):
+    _clock_nanosleep = None
+
+
+def sleep_until_ns(deadline_ns):
+    """Sleep until deadline_ns on the monotonic clock (time.monotonic_ns())"""
+    if _clock_nanosleep is not None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None)
+    else:
+        delay_ns = deadline_ns - time.monotonic_ns()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
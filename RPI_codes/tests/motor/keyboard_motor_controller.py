@@ -25,31 +25,46 @@ Author: GIQ_2025 Project
 import sys
 import os
 import time
+import logging
 import threading
+import select
+import queue
+import ctypes
+
+from _timing import sleep_until_ns
+
+logger = logging.getLogger(__name__)
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Try to import GPIO library - RPi 5 prefers gpiod, fallback to RPi.GPIO for Pi 4/3
+# Try to import GPIO library - RPi 5 prefers lgpio (timed PWM without a Python
+# thread), then gpiod (software PWM), fallback to RPi.GPIO for Pi 4/3
 GPIO_AVAILABLE = False
 GPIO_BACKEND = None
 
 try:
-    import gpiod
-    from gpiod.line import Direction, Value
+    import lgpio
     GPIO_AVAILABLE = True
-    GPIO_BACKEND = 'gpiod'
-    print("✅ Using gpiod (Raspberry Pi 5 native)")
+    GPIO_BACKEND = 'lgpio'
+    print("✅ Using lgpio (Raspberry Pi 5, timed PWM)")
 except ImportError:
     try:
-        import RPi.GPIO as GPIO
+        import gpiod
+        from gpiod.line import Direction, Value
         GPIO_AVAILABLE = True
-        GPIO_BACKEND = 'RPi.GPIO'
-        print("✅ Using RPi.GPIO (Raspberry Pi 4/3 compatible)")
-    except (ImportError, RuntimeError):
-        GPIO_AVAILABLE = False
-        GPIO_BACKEND = None
-        print("⚠️  WARNING: No GPIO library available - Running in SIMULATION mode")
+        GPIO_BACKEND = 'gpiod'
+        print("✅ Using gpiod (Raspberry Pi 5 native)")
+    except ImportError:
+        try:
+            import RPi.GPIO as GPIO
+            GPIO_AVAILABLE = True
+            GPIO_BACKEND = 'RPi.GPIO'
+            print("✅ Using RPi.GPIO (Raspberry Pi 4/3 compatible)")
+        except (ImportError, RuntimeError):
+            GPIO_AVAILABLE = False
+            GPIO_BACKEND = None
+            print("⚠️  WARNING: No GPIO library available - Running in SIMULATION mode")
 
 # Try to import keyboard input library
 try:
@@ -74,6 +89,21 @@ MOTOR_RIGHT_DIR2 = 26
 # PWM Frequency
 PWM_FREQUENCY = 1000  # 1 kHz
 
+# Kernel PWM channels (gpiod backend, opt-in with --kernel-pwm). Only enable
+# it once these channels are routed to GPIO12/13 - e.g. via dtoverlay=pwm-2chan,
+# see KEYBOARD_CONTROLLER_GUIDE.md. PWM then runs in the kernel and no software
+# PWM thread is started. A pwmchip existing says nothing about which pins it
+# drives, so it is never auto-detected. (pwmchip dir, channel)
+PWM_SYSFS_LEFT = ('/sys/class/pwm/pwmchip0', 0)   # GPIO12
+PWM_SYSFS_RIGHT = ('/sys/class/pwm/pwmchip0', 1)  # GPIO13
+
+# Software PWM thread scheduling (gpiod backend, needs root/CAP_SYS_NICE)
+PWM_CPU_CORE = 3       # Pin the PWM thread to this core (isolate it with isolcpus=3)
+PWM_RT_PRIORITY = 80   # SCHED_FIFO priority for the PWM thread
+
+# Arrow key escape sequences (chars after ESC) -> key name
+ESC_SEQUENCES = {'[A': 'UP', '[B': 'DOWN', '[C': 'RIGHT', '[D': 'LEFT'}
+
 # Movement settings
 DEFAULT_SPEED = 50  # Default speed percentage
 TILT_SPEED = 30     # Slow speed for tilting/turning
@@ -82,65 +112,177 @@ MAX_SPEED = 100
 MIN_SPEED = 20
 
 
+def direction_bits(speed):
+    """
+    Direction pin levels for a motor speed.
+
+    Returns:
+        (dir1, dir2): (1, 0) forward, (0, 1) reverse, (0, 0) stop
+    """
+    if speed > 0:  # Forward
+        return 1, 0
+    if speed < 0:  # Reverse
+        return 0, 1
+    return 0, 0  # Stop
+
+
 class MotorController:
     """L298N Motor Controller for 2 DC motors - RPi 5 Optimized"""
 
-    def __init__(self, simulate=False):
+    def __init__(self, simulate=False, kernel_pwm=False):
         """
         Initialize motor controller.
 
         Args:
             simulate: If True, simulate motor control without GPIO
+            kernel_pwm: Use the kernel PWM channels (PWM_SYSFS_LEFT/RIGHT) for
+                        speed on the gpiod backend instead of software PWM
         """
         self.simulate = simulate or not GPIO_AVAILABLE
+        self.kernel_pwm = kernel_pwm
         self.backend = GPIO_BACKEND
         self.left_pwm = None
         self.right_pwm = None
-        self.left_pwm_duty = 0
-        self.right_pwm_duty = 0
+        # Last commanded (left, right) speeds - repeated commands skip the GPIO
+        self._state = (0, 0)
+        # Software PWM duty [left, right] in whole percent. Aligned 32-bit
+        # stores are atomic, so the PWM thread reads them without a lock.
+        self._duty = (ctypes.c_int32 * 2)()
+        # On-time in integer nanoseconds for each whole-percent duty (0-100)
+        self._on_ns = [1_000_000_000 // PWM_FREQUENCY * d // 100 for d in range(101)]
+
+        # For lgpio backend
+        self.handle = None
 
         # For gpiod backend
         self.chip = None
-        self.lines = {}
+        self._bulk = None  # All output lines in one request
+        self._bulk_width = 0
+        self._dir_values = [0, 0, 0, 0]  # [L_DIR1, L_DIR2, R_DIR1, R_DIR2]
+        self._apply_dirs = None  # (dir_values) -> None
         self.pwm_thread = None
         self.pwm_running = False
+        self._pwm_fds = []  # duty_cycle fds when using kernel PWM
+        self._write_duty = None  # (channel, percent) -> None
+
+        # Backend-specific motor setters, chosen once so set_*_motor skips
+        # the backend string compares on every call
+        self._set_left = self._set_left_sim
+        self._set_right = self._set_right_sim
+        self._set_both = self._set_both_sim
 
         if not self.simulate:
-            if self.backend == 'gpiod':
+            if self.backend == 'lgpio':
+                # Raspberry Pi 5 - Use lgpio timed PWM
+                self._setup_lgpio()
+                self._set_left = self._set_left_lgpio
+                self._set_right = self._set_right_lgpio
+                self._set_both = self._set_both_lgpio
+            elif self.backend == 'gpiod':
                 # Raspberry Pi 5 - Use gpiod
                 self._setup_gpiod()
+                self._set_left = self._set_left_gpiod
+                self._set_right = self._set_right_gpiod
+                self._set_both = self._set_both_gpiod
             elif self.backend == 'RPi.GPIO':
                 # Raspberry Pi 4/3 - Use RPi.GPIO
                 self._setup_rpi_gpio()
+                self._set_left = self._set_left_rpi_gpio
+                self._set_right = self._set_right_rpi_gpio
+                self._set_both = self._set_both_rpi_gpio
 
             print(f"✅ GPIO initialized ({self.backend}) - Motors ready")
         else:
             print("ℹ️  Simulation mode - No actual motor control")
 
+    def _setup_lgpio(self):
+        """Setup GPIO using lgpio for Raspberry Pi 5"""
+        # Open GPIO chip
+        self.handle = lgpio.gpiochip_open(4)  # RPi 5 uses gpiochip4
+
+        # Configure all pins as outputs. The four direction pins form one
+        # group (bits 0-3 = L_DIR1, L_DIR2, R_DIR1, R_DIR2) written with a
+        # single group_write; the left motor owns mask 0b0011, right 0b1100.
+        lgpio.gpio_claim_output(self.handle, MOTOR_LEFT_PWM, 0)
+        lgpio.gpio_claim_output(self.handle, MOTOR_RIGHT_PWM, 0)
+        lgpio.group_claim_output(self.handle,
+                                 [MOTOR_LEFT_DIR1, MOTOR_LEFT_DIR2,
+                                  MOTOR_RIGHT_DIR1, MOTOR_RIGHT_DIR2],
+                                 [0, 0, 0, 0])
+
+        # PWM is generated by lgpio off the Python thread - start at 0% duty
+        lgpio.tx_pwm(self.handle, MOTOR_LEFT_PWM, PWM_FREQUENCY, 0)
+        lgpio.tx_pwm(self.handle, MOTOR_RIGHT_PWM, PWM_FREQUENCY, 0)
+
     def _setup_gpiod(self):
         """Setup GPIO using gpiod for Raspberry Pi 5"""
         # Open GPIO chip
         self.chip = gpiod.Chip('/dev/gpiochip4')  # RPi 5 uses gpiochip4
 
-        # Configure all pins as outputs
-        pin_config = {
-            'left_pwm': MOTOR_LEFT_PWM,
-            'left_dir1': MOTOR_LEFT_DIR1,
-            'left_dir2': MOTOR_LEFT_DIR2,
-            'right_pwm': MOTOR_RIGHT_PWM,
-            'right_dir1': MOTOR_RIGHT_DIR1,
-            'right_dir2': MOTOR_RIGHT_DIR2,
-        }
-
-        for name, pin in pin_config.items():
-            line = self.chip.get_line(pin)
-            line.request(consumer="keyboard_controller", type=gpiod.LINE_REQ_DIR_OUT)
-            self.lines[name] = line
-
-        # Start software PWM thread for gpiod
-        self.pwm_running = True
-        self.pwm_thread = threading.Thread(target=self._software_pwm, daemon=True)
-        self.pwm_thread.start()
+        # Every output is claimed in a single bulk request (one ioctl) and
+        # written with set_values(). Line order: L_DIR1, L_DIR2, R_DIR1, R_DIR2
+        # and, for software PWM, L_PWM, R_PWM.
+        pins = [MOTOR_LEFT_DIR1, MOTOR_LEFT_DIR2, MOTOR_RIGHT_DIR1, MOTOR_RIGHT_DIR2]
+        kernel_pwm = self.kernel_pwm
+        if kernel_pwm and not (os.path.isdir(PWM_SYSFS_LEFT[0]) and os.path.isdir(PWM_SYSFS_RIGHT[0])):
+            print(f"⚠️  {PWM_SYSFS_LEFT[0]} not found - falling back to software PWM")
+            kernel_pwm = False
+        if not kernel_pwm:
+            pins += [MOTOR_LEFT_PWM, MOTOR_RIGHT_PWM]
+
+        self._bulk = self.chip.get_lines(pins)
+        self._bulk.request(consumer="keyboard_controller",
+                           type=gpiod.LINE_REQ_DIR_OUT, default_vals=[0] * len(pins))
+        self._bulk_width = len(pins)
+
+        if kernel_pwm:
+            # Kernel PWM - the driver times the edges, no Python thread
+            self._setup_sysfs_pwm()
+            self._write_duty = self._write_duty_sysfs
+            self._apply_dirs = self._apply_dirs_now
+            print("✅ Using kernel PWM (sysfs)")
+        else:
+            # Software PWM - the PWM thread is the only writer of the bulk and
+            # applies published direction levels at the next period start
+            self._write_duty = self._write_duty_software
+            self._apply_dirs = self._publish_dirs
+            self.pwm_running = True
+            self.pwm_thread = threading.Thread(target=self._software_pwm, daemon=True)
+            self.pwm_thread.start()
+
+    def _setup_sysfs_pwm(self):
+        """Export and enable the kernel PWM channels, keeping duty_cycle fds open"""
+        period_ns = 1_000_000_000 // PWM_FREQUENCY
+
+        for chip_dir, channel in (PWM_SYSFS_LEFT, PWM_SYSFS_RIGHT):
+            channel_dir = os.path.join(chip_dir, f'pwm{channel}')
+            if not os.path.isdir(channel_dir):
+                with open(os.path.join(chip_dir, 'export'), 'w') as f:
+                    f.write(str(channel))
+
+            # Duty first - the kernel rejects a period shorter than the duty
+            for name, value in (('duty_cycle', 0), ('period', period_ns), ('enable', 1)):
+                with open(os.path.join(channel_dir, name), 'w') as f:
+                    f.write(str(value))
+
+            self._pwm_fds.append(os.open(os.path.join(channel_dir, 'duty_cycle'), os.O_WRONLY))
+
+    def _write_duty_sysfs(self, channel, percent):
+        """Set kernel PWM duty - one pwrite() syscall"""
+        os.pwrite(self._pwm_fds[channel], b'%d' % self._on_ns[percent], 0)
+
+    def _write_duty_software(self, channel, percent):
+        """Set software PWM duty - picked up by the PWM thread next period"""
+        self._duty[channel] = percent
+
+    def _apply_dirs_now(self, dir_values):
+        """Write direction levels immediately (kernel PWM mode)"""
+        self._bulk.set_values(dir_values)
+        self._dir_values = dir_values
+
+    def _publish_dirs(self, dir_values):
+        """Hand direction levels to the PWM thread (software PWM mode)"""
+        self._dir_values = dir_values  # Reference swap - atomic for the reader
 
     def _setup_rpi_gpio(self):
         """Setup GPIO using RPi.GPIO for Raspberry Pi 4/3"""
@@ -166,39 +308,67 @@ class MotorController:
         self.right_pwm.start(0)
 
     def _software_pwm(self):
-        """Software PWM implementation for gpiod backend"""
-        period = 1.0 / PWM_FREQUENCY  # Period in seconds
+        """
+        Software PWM implementation for gpiod backend.
+
+        Both channels share one period: lines go high together at the period
+        start and each falls at its own duty offset, visited in time order.
+        Each edge sleeps until an absolute deadline in integer nanoseconds, so
+        sleep overshoot never accumulates into the period.
+        """
+        # Run on a dedicated core at real-time priority to cut scheduling jitter.
+        # Best effort - without privileges the thread keeps default scheduling.
+        try:
+            os.sched_setaffinity(0, {PWM_CPU_CORE})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(PWM_RT_PRIORITY))
+        except (AttributeError, OSError) as e:
+            print(f"⚠️  PWM thread not real-time ({e}) - expect more jitter")
+
+        period_ns = 1_000_000_000 // PWM_FREQUENCY
+
+        # Bind everything the loop touches to locals - each edge is then one
+        # local load + C call instead of attribute/dict/global lookups
+        set_values = self._bulk.set_values
+        sleep_until = sleep_until_ns
+        now_ns = time.monotonic_ns
+        period_start = now_ns()
+
+        duty = self._duty
+        on_ns = self._on_ns
 
         while self.pwm_running:
-            # Left motor PWM
-            if self.left_pwm_duty > 0:
-                on_time = period * (self.left_pwm_duty / 100.0)
-                off_time = period - on_time
-
-                if on_time > 0:
-                    self.lines['left_pwm'].set_value(1)
-                    time.sleep(on_time)
-                if off_time > 0:
-                    self.lines['left_pwm'].set_value(0)
-                    time.sleep(off_time)
+            # Sample duties and direction levels once per period
+            left_off = on_ns[duty[0]]
+            right_off = on_ns[duty[1]]
+            values = self._dir_values + [1 if left_off > 0 else 0,
+                                         1 if right_off > 0 else 0]
+
+            # Direction + rising edges in one write
+            set_values(values)
+
+            # Falling edges, earliest first (0% is already low, 100% stays high)
+            # Indices 4/5 are the left/right PWM lines in the bulk
+            if left_off <= right_off:
+                first_off, first_idx, second_off, second_idx = left_off, 4, right_off, 5
             else:
-                self.lines['left_pwm'].set_value(0)
-                time.sleep(period)
-
-            # Right motor PWM (interleaved for better performance)
-            if self.right_pwm_duty > 0:
-                on_time = period * (self.right_pwm_duty / 100.0)
-                off_time = period - on_time
-
-                if on_time > 0:
-                    self.lines['right_pwm'].set_value(1)
-                    time.sleep(on_time)
-                if off_time > 0:
-                    self.lines['right_pwm'].set_value(0)
-                    time.sleep(off_time)
+                first_off, first_idx, second_off, second_idx = right_off, 5, left_off, 4
+
+            if 0 < first_off < period_ns:
+                sleep_until(period_start + first_off)
+                values[first_idx] = 0
+                set_values(values)
+            if 0 < second_off < period_ns:
+                sleep_until(period_start + second_off)
+                values[second_idx] = 0
+                set_values(values)
+
+            # Wait for the next period
+            period_start += period_ns
+            if now_ns() - period_start > period_ns:
+                # Fell more than a period behind - resync instead of bursting
+                period_start = now_ns()
             else:
-                self.lines['right_pwm'].set_value(0)
-                time.sleep(period)
+                sleep_until(period_start)
 
     def set_left_motor(self, speed: float):
         """
@@ -208,41 +378,8 @@ class MotorController:
             speed: Speed from -100 (full reverse) to 100 (full forward)
         """
         speed = max(-100, min(100, speed))  # Clamp to -100..100
-
-        if self.simulate:
-            if abs(speed) > 1:
-                print(f"LEFT:  {'FWD' if speed > 0 else 'REV'} {abs(speed):3.0f}%", end="  ")
-            return
-
-        if self.backend == 'gpiod':
-            # gpiod backend
-            if speed > 0:  # Forward
-                self.lines['left_dir1'].set_value(1)
-                self.lines['left_dir2'].set_value(0)
-            elif speed < 0:  # Reverse
-                self.lines['left_dir1'].set_value(0)
-                self.lines['left_dir2'].set_value(1)
-            else:  # Stop
-                self.lines['left_dir1'].set_value(0)
-                self.lines['left_dir2'].set_value(0)
-
-            # Update PWM duty cycle
-            self.left_pwm_duty = abs(speed)
-
-        elif self.backend == 'RPi.GPIO':
-            # RPi.GPIO backend
-            if speed > 0:  # Forward
-                GPIO.output(MOTOR_LEFT_DIR1, GPIO.HIGH)
-                GPIO.output(MOTOR_LEFT_DIR2, GPIO.LOW)
-            elif speed < 0:  # Reverse
-                GPIO.output(MOTOR_LEFT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_LEFT_DIR2, GPIO.HIGH)
-            else:  # Stop
-                GPIO.output(MOTOR_LEFT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_LEFT_DIR2, GPIO.LOW)
-
-            # Set speed
-            self.left_pwm.ChangeDutyCycle(abs(speed))
+        self._state = (speed, self._state[1])
+        self._set_left(speed)
 
     def set_right_motor(self, speed: float):
         """
@@ -252,60 +389,123 @@ class MotorController:
             speed: Speed from -100 (full reverse) to 100 (full forward)
         """
         speed = max(-100, min(100, speed))  # Clamp to -100..100
+        self._state = (self._state[0], speed)
+        self._set_right(speed)
 
-        if self.simulate:
-            if abs(speed) > 1:
-                print(f"RIGHT: {'FWD' if speed > 0 else 'REV'} {abs(speed):3.0f}%")
-            return
+    def set_motors(self, left_speed: float, right_speed: float):
+        """
+        Set both motors in one update, so they change on the same write.
+        Does nothing if the motors are already at these speeds.
 
-        if self.backend == 'gpiod':
-            # gpiod backend
-            if speed > 0:  # Forward
-                self.lines['right_dir1'].set_value(1)
-                self.lines['right_dir2'].set_value(0)
-            elif speed < 0:  # Reverse
-                self.lines['right_dir1'].set_value(0)
-                self.lines['right_dir2'].set_value(1)
-            else:  # Stop
-                self.lines['right_dir1'].set_value(0)
-                self.lines['right_dir2'].set_value(0)
-
-            # Update PWM duty cycle
-            self.right_pwm_duty = abs(speed)
-
-        elif self.backend == 'RPi.GPIO':
-            # RPi.GPIO backend
-            if speed > 0:  # Forward
-                GPIO.output(MOTOR_RIGHT_DIR1, GPIO.HIGH)
-                GPIO.output(MOTOR_RIGHT_DIR2, GPIO.LOW)
-            elif speed < 0:  # Reverse
-                GPIO.output(MOTOR_RIGHT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_RIGHT_DIR2, GPIO.HIGH)
-            else:  # Stop
-                GPIO.output(MOTOR_RIGHT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_RIGHT_DIR2, GPIO.LOW)
-
-            # Set speed
-            self.right_pwm.ChangeDutyCycle(abs(speed))
+        Args:
+            left_speed: Left speed from -100 (full reverse) to 100 (full forward)
+            right_speed: Right speed from -100 (full reverse) to 100 (full forward)
+        """
+        state = (max(-100, min(100, left_speed)), max(-100, min(100, right_speed)))
+        if state == self._state:
+            return
+        self._state = state
+        self._set_both(*state)
+
+    def _set_left_sim(self, speed):
+        """Simulated left motor update (speed already clamped) - logged at DEBUG"""
+        if abs(speed) > 1 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LEFT:  %s %3.0f%%", 'FWD' if speed > 0 else 'REV', abs(speed))
+
+    def _set_right_sim(self, speed):
+        """Simulated right motor update (speed already clamped) - logged at DEBUG"""
+        if abs(speed) > 1 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RIGHT: %s %3.0f%%", 'FWD' if speed > 0 else 'REV', abs(speed))
+
+    def _set_both_sim(self, left_speed, right_speed):
+        """Simulated update of both motors (speeds already clamped)"""
+        self._set_left_sim(left_speed)
+        self._set_right_sim(right_speed)
+
+    def _set_left_lgpio(self, speed):
+        """lgpio left motor update (speed already clamped)"""
+        d1, d2 = direction_bits(speed)
+        lgpio.group_write(self.handle, MOTOR_LEFT_DIR1, d1 | d2 << 1, 0b0011)
+        lgpio.tx_pwm(self.handle, MOTOR_LEFT_PWM, PWM_FREQUENCY, abs(speed))
+
+    def _set_right_lgpio(self, speed):
+        """lgpio right motor update (speed already clamped)"""
+        d1, d2 = direction_bits(speed)
+        lgpio.group_write(self.handle, MOTOR_LEFT_DIR1, d1 << 2 | d2 << 3, 0b1100)
+        lgpio.tx_pwm(self.handle, MOTOR_RIGHT_PWM, PWM_FREQUENCY, abs(speed))
+
+    def _set_both_lgpio(self, left_speed, right_speed):
+        """lgpio update of both motors (speeds already clamped)"""
+        l1, l2 = direction_bits(left_speed)
+        r1, r2 = direction_bits(right_speed)
+        lgpio.group_write(self.handle, MOTOR_LEFT_DIR1,
+                          l1 | l2 << 1 | r1 << 2 | r2 << 3, 0b1111)
+        lgpio.tx_pwm(self.handle, MOTOR_LEFT_PWM, PWM_FREQUENCY, abs(left_speed))
+        lgpio.tx_pwm(self.handle, MOTOR_RIGHT_PWM, PWM_FREQUENCY, abs(right_speed))
+
+    def _set_left_gpiod(self, speed):
+        """gpiod left motor update (speed already clamped)"""
+        self._apply_dirs(list(direction_bits(speed)) + self._dir_values[2:])
+        self._write_duty(0, int(abs(speed)))
+
+    def _set_right_gpiod(self, speed):
+        """gpiod right motor update (speed already clamped)"""
+        self._apply_dirs(self._dir_values[:2] + list(direction_bits(speed)))
+        self._write_duty(1, int(abs(speed)))
+
+    def _set_both_gpiod(self, left_speed, right_speed):
+        """gpiod update of both motors (speeds already clamped)"""
+        self._apply_dirs(list(direction_bits(left_speed) + direction_bits(right_speed)))
+        self._write_duty(0, int(abs(left_speed)))
+        self._write_duty(1, int(abs(right_speed)))
+
+    def _set_left_rpi_gpio(self, speed):
+        """RPi.GPIO left motor update (speed already clamped)"""
+        GPIO.output([MOTOR_LEFT_DIR1, MOTOR_LEFT_DIR2], direction_bits(speed))
+        self.left_pwm.ChangeDutyCycle(abs(speed))
+
+    def _set_right_rpi_gpio(self, speed):
+        """RPi.GPIO right motor update (speed already clamped)"""
+        GPIO.output([MOTOR_RIGHT_DIR1, MOTOR_RIGHT_DIR2], direction_bits(speed))
+        self.right_pwm.ChangeDutyCycle(abs(speed))
+
+    def _set_both_rpi_gpio(self, left_speed, right_speed):
+        """RPi.GPIO update of both motors (speeds already clamped)"""
+        GPIO.output([MOTOR_LEFT_DIR1, MOTOR_LEFT_DIR2, MOTOR_RIGHT_DIR1, MOTOR_RIGHT_DIR2],
+                    direction_bits(left_speed) + direction_bits(right_speed))
+        self.left_pwm.ChangeDutyCycle(abs(left_speed))
+        self.right_pwm.ChangeDutyCycle(abs(right_speed))
 
     def stop(self):
         """Stop both motors"""
-        self.set_left_motor(0)
-        self.set_right_motor(0)
+        self.set_motors(0, 0)
 
     def cleanup(self):
         """Cleanup GPIO"""
         self.stop()
         if not self.simulate:
-            if self.backend == 'gpiod':
+            if self.backend == 'lgpio':
+                # Stop PWM output and release the chip
+                lgpio.tx_pwm(self.handle, MOTOR_LEFT_PWM, PWM_FREQUENCY, 0)
+                lgpio.tx_pwm(self.handle, MOTOR_RIGHT_PWM, PWM_FREQUENCY, 0)
+                lgpio.gpiochip_close(self.handle)
+
+            elif self.backend == 'gpiod':
                 # Stop PWM thread
                 self.pwm_running = False
                 if self.pwm_thread:
                     self.pwm_thread.join(timeout=1.0)
 
-                # Release all lines
-                for line in self.lines.values():
-                    line.release()
+                # Disable kernel PWM channels
+                for fd, (chip_dir, channel) in zip(self._pwm_fds, (PWM_SYSFS_LEFT, PWM_SYSFS_RIGHT)):
+                    os.close(fd)
+                    with open(os.path.join(chip_dir, f'pwm{channel}', 'enable'), 'w') as f:
+                        f.write('0')
+
+                # Drive all lines low (the stopped PWM thread may not have
+                # applied the final stop) and release them
+                self._bulk.set_values([0] * self._bulk_width)
+                self._bulk.release()
 
                 # Close chip
                 if self.chip:
@@ -348,9 +548,14 @@ class KeyboardInput:
         if self.old_settings and self.fd:
             termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
 
-    def get_key(self):
+    def get_key(self, timeout=0.2):
         """
-        Get a single keypress.
+        Wait up to timeout seconds for a single keypress.
+
+        Reads the file descriptor directly: select() only sees bytes still in
+        the kernel, so a buffered sys.stdin could hide an escape sequence.
+        The terminal writes an arrow key's whole sequence at once, so a
+        single read returns it.
 
         Returns:
             str: The key pressed, or empty string if none
@@ -359,48 +564,132 @@ class KeyboardInput:
             return ''
 
         try:
-            key = sys.stdin.read(1)
-            # Handle escape sequences
-            if key == '\x1b':  # ESC
-                # Read next two chars for arrow keys
-                next_chars = sys.stdin.read(2)
-                if next_chars == '[A':
-                    return 'UP'
-                elif next_chars == '[B':
-                    return 'DOWN'
-                elif next_chars == '[C':
-                    return 'RIGHT'
-                elif next_chars == '[D':
-                    return 'LEFT'
-                else:
+            # Sleep in the kernel until a key arrives
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            if not ready:
+                return ''
+
+            data = os.read(self.fd, 8)
+            if not data:
+                return ''
+            # Handle escape sequences (a lone ESC has nothing after it)
+            if data[0] == 0x1b:
+                if len(data) == 1:
                     return 'ESC'
-            return key.lower()
+                return ESC_SEQUENCES.get(data[1:3].decode('ascii', 'ignore'), 'ESC')
+            return chr(data[0]).lower()
         except Exception:
             return ''
 
 
+class StatusLine:
+    """Terminal status output drained by a background thread"""
+
+    def __init__(self):
+        """Start the printer thread"""
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def show(self, message):
+        """
+        Queue a message for printing without blocking the control loop.
+
+        Args:
+            message: Text written as-is (include '\r' to overwrite the line)
+        """
+        self._queue.put_nowait(message)
+
+    def close(self):
+        """Print pending messages and stop the printer thread"""
+        self._queue.put_nowait(None)
+        self._thread.join(timeout=1.0)
+
+    def _worker(self):
+        """Write queued messages to stdout"""
+        while True:
+            message = self._queue.get()
+            if message is None:
+                return
+            sys.stdout.write(message)
+            sys.stdout.flush()
+
+
+class MotorWorker:
+    """
+    Applies motor commands on a background thread so a slow GPIO write
+    never delays reading the keyboard. Exposes set_motors()/stop() like
+    MotorController, so the movement helpers accept either.
+    """
+
+    def __init__(self, motors):
+        """
+        Start the worker thread
+
+        Args:
+            motors: MotorController that executes the commands
+        """
+        self.motors = motors
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def set_motors(self, left_speed, right_speed):
+        """Queue a speed change for both motors"""
+        self._queue.put_nowait((self._generation, left_speed, right_speed))
+
+    def stop(self):
+        """Stop immediately on the calling thread and drop queued commands"""
+        with self._lock:
+            self._generation += 1
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.motors.set_motors(0, 0)
+
+    def close(self):
+        """Stop the motors and the worker thread"""
+        self.stop()
+        self._queue.put_nowait(None)
+        self._thread.join(timeout=1.0)
+
+    def _worker(self):
+        """Execute queued commands"""
+        while True:
+            command = self._queue.get()
+            if command is None:
+                return
+            generation, left_speed, right_speed = command
+            with self._lock:
+                # Skip commands issued before the last stop
+                if generation == self._generation:
+                    self.motors.set_motors(left_speed, right_speed)
+
+
 def move_forward(motors, speed):
     """Move both motors forward"""
-    motors.set_left_motor(speed)
-    motors.set_right_motor(speed)
+    motors.set_motors(speed, speed)
 
 
 def move_backward(motors, speed):
     """Move both motors backward"""
-    motors.set_left_motor(-speed)
-    motors.set_right_motor(-speed)
+    motors.set_motors(-speed, -speed)
 
 
 def tilt_left(motors):
     """Slow turn left - left motor slower than right"""
-    motors.set_left_motor(TILT_SPEED * 0.3)  # Left motor at 30% of tilt speed
-    motors.set_right_motor(TILT_SPEED)       # Right motor at full tilt speed
+    # Left motor at 30% of tilt speed, right motor at full tilt speed
+    motors.set_motors(TILT_SPEED * 0.3, TILT_SPEED)
 
 
 def tilt_right(motors):
     """Slow turn right - right motor slower than left"""
-    motors.set_left_motor(TILT_SPEED)        # Left motor at full tilt speed
-    motors.set_right_motor(TILT_SPEED * 0.3)  # Right motor at 30% of tilt speed
+    # Left motor at full tilt speed, right motor at 30% of tilt speed
+    motors.set_motors(TILT_SPEED, TILT_SPEED * 0.3)
 
 
 def main():
@@ -422,6 +711,10 @@ def main():
     # Check for simulation mode override
     simulate = '--simulate' in sys.argv
 
+    # --verbose shows per-motor updates (simulation mode)
+    logging.basicConfig(level=logging.DEBUG if '--verbose' in sys.argv else logging.INFO,
+                        format='%(message)s')
+
     # Initialize keyboard input
     keyboard = KeyboardInput()
     if not keyboard.setup():
@@ -429,10 +722,16 @@ def main():
         print("Run with: python3 keyboard_motor_controller.py")
         return
 
+    # Terminal output goes through a printer thread so the control loop
+    # never waits on a tty flush
+    status = StatusLine()
+
     try:
         # Initialize motors
         print("Initializing motor controller...")
-        motors = MotorController(simulate=simulate)
+        motors = MotorController(simulate=simulate, kernel_pwm='--kernel-pwm' in sys.argv)
+        # Keypresses queue commands; SPACE still stops on this thread
+        commands = MotorWorker(motors)
 
         # Current speed setting
         current_speed = DEFAULT_SPEED
@@ -449,48 +748,45 @@ def main():
             if key and key != last_key:
                 if key == 'w':
                     # Forward
-                    move_forward(motors, current_speed)
-                    print(f"\r⬆️  FORWARD at {current_speed}%     ", end='', flush=True)
+                    move_forward(commands, current_speed)
+                    status.show(f"\r⬆️  FORWARD at {current_speed}%     ")
 
                 elif key == 's':
                     # Backward
-                    move_backward(motors, current_speed)
-                    print(f"\r⬇️  REVERSE at {current_speed}%     ", end='', flush=True)
+                    move_backward(commands, current_speed)
+                    status.show(f"\r⬇️  REVERSE at {current_speed}%     ")
 
                 elif key == 'a':
                     # Tilt left (slow)
-                    tilt_left(motors)
-                    print(f"\r⬅️  TILT LEFT at {TILT_SPEED}% (slow)     ", end='', flush=True)
+                    tilt_left(commands)
+                    status.show(f"\r⬅️  TILT LEFT at {TILT_SPEED}% (slow)     ")
 
                 elif key == 'd':
                     # Tilt right (slow)
-                    tilt_right(motors)
-                    print(f"\r➡️  TILT RIGHT at {TILT_SPEED}% (slow)     ", end='', flush=True)
+                    tilt_right(commands)
+                    status.show(f"\r➡️  TILT RIGHT at {TILT_SPEED}% (slow)     ")
 
                 elif key == 'q':
                     # Increase speed
                     current_speed = min(MAX_SPEED, current_speed + SPEED_INCREMENT)
-                    print(f"\r🔼 Speed increased to {current_speed}%     ", end='', flush=True)
+                    status.show(f"\r🔼 Speed increased to {current_speed}%     ")
 
                 elif key == 'e':
                     # Decrease speed
                     current_speed = max(MIN_SPEED, current_speed - SPEED_INCREMENT)
-                    print(f"\r🔽 Speed decreased to {current_speed}%     ", end='', flush=True)
+                    status.show(f"\r🔽 Speed decreased to {current_speed}%     ")
 
                 elif key == ' ':
                     # Stop
-                    motors.stop()
-                    print(f"\r🛑 STOPPED                    ", end='', flush=True)
+                    commands.stop()
+                    status.show(f"\r🛑 STOPPED                    ")
 
-                elif key == 'esc' or key == '\x03':  # ESC or Ctrl+C
-                    print("\n\n👋 Exit requested")
+                elif key == 'ESC' or key == '\x03':  # ESC or Ctrl+C
+                    status.show("\n\n👋 Exit requested\n")
                     running = False
 
                 last_key = key
 
-            # Small delay to prevent CPU overload
-            time.sleep(0.01)
-
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
     except Exception as e:
@@ -499,8 +795,11 @@ def main():
         traceback.print_exc()
     finally:
         # Cleanup
+        status.close()
         print("\n\nCleaning up...")
         keyboard.cleanup()
+        if 'commands' in locals():
+            commands.close()
         if 'motors' in locals():
             motors.cleanup()
         print("✅ Cleanup complete")
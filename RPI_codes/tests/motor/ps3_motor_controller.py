@@ -25,8 +25,19 @@ Controls:
 import sys
 import os
 import time
+import select
 import pygame
 
+from _timing import sleep_until_ns
+
+# evdev reads the controller straight from the kernel (Linux only) - optional
+try:
+    import evdev
+    from evdev import ecodes
+    EVDEV_AVAILABLE = True
+except ImportError:
+    EVDEV_AVAILABLE = False
+
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -62,12 +73,46 @@ MOTOR_RIGHT_PWM = 13
 MOTOR_RIGHT_DIR1 = 19
 MOTOR_RIGHT_DIR2 = 26
 
+# (DIR1, DIR2) levels indexed by (speed > 0) * 2 + (speed < 0):
+# 0 = stop, 1 = reverse, 2 = forward (3 can't happen)
+DIR_TABLE = ([0, 0], [0, 1], [1, 0], [1, 0])
+
 # PWM Frequency
 PWM_FREQUENCY = 1000  # 1 kHz
 
+# Kernel PWM channels for GPIO12/13 (needs dtoverlay=pwm-2chan,pin=12,func=4,pin2=13,func2=4).
+# Opt-in with --hardware-pwm: a pwmchip existing doesn't prove its channels are
+# routed to GPIO12/13, so the software PWM thread stays the default.
+PWM_SYSFS_LEFT = ('/sys/class/pwm/pwmchip0', 0)   # GPIO12
+PWM_SYSFS_RIGHT = ('/sys/class/pwm/pwmchip0', 1)  # GPIO13
+PWM_NS_PER_PERCENT = 10_000_000 // PWM_FREQUENCY  # duty_cycle ns per 1% duty
+
+# Real-time scheduling (needs sudo; isolate the cores with isolcpus=2,3 nohz_full=2,3 rcu_nocbs=2,3)
+PWM_CPU_CORE = 3        # Software PWM thread
+PWM_RT_PRIORITY = 50    # SCHED_FIFO priority for the software PWM thread
+CONTROL_CPU_CORE = 2    # Main control loop
+CONTROL_NICE = -10      # Niceness for the main control loop
+
 # Dead zone for joystick (prevents drift)
 DEAD_ZONE = 0.15
 
+# Stick smoothing (exponential moving average) to filter jitter
+STICK_SMOOTHING = 0.5         # Weight of the newest sample (1.0 = no smoothing)
+STICK_SETTLE_EPSILON = 0.01   # Snap to the raw value once this close
+
+# Linear prediction: extrapolate the stick along its current velocity so the
+# motor command leads the input by about one loop period
+PREDICT_LOOKAHEAD = 0.02  # Seconds ahead
+PREDICT_MAX_DT = 0.1      # Samples further apart than this are too stale to extrapolate
+
+# Skip motor writes smaller than this (percent) - stick noise would otherwise
+# cause a GPIO write on every event
+MOTOR_UPDATE_THRESHOLD = 1.0
+
+# Status line layout (filled with % formatting)
+STATUS_TEMPLATE = "\r%s Mode: %-6s | Stick: (%+5.2f, %+5.2f) | L: %+6.1f%% | R: %+6.1f%%   "
+STATUS_INTERVAL = 0.1  # Seconds between status updates
+
 # Speed modes
 SPEED_MODES = {
     'SLOW': 30,
@@ -79,14 +124,17 @@ SPEED_MODES = {
 class MotorController:
     """L298N Motor Controller for 2 DC motors - RPi 5 Optimized"""
 
-    def __init__(self, simulate=False):
+    def __init__(self, simulate=False, hardware_pwm=False):
         """
         Initialize motor controller.
 
         Args:
             simulate: If True, simulate motor control without GPIO
+            hardware_pwm: Use the kernel PWM channels (PWM_SYSFS_LEFT/RIGHT) on
+                          the gpiod backend instead of software PWM
         """
         self.simulate = simulate or not GPIO_AVAILABLE
+        self.hardware_pwm = hardware_pwm
         self.backend = GPIO_BACKEND
         self.left_pwm = None
         self.right_pwm = None
@@ -96,8 +144,17 @@ class MotorController:
         # For gpiod backend
         self.chip = None
         self.lines = {}
+        self._left_bulk = None   # (dir1, dir2) LineBulk per motor
+        self._right_bulk = None
         self.pwm_thread = None
         self.pwm_running = False
+        self.left_duty_file = None   # Kernel PWM duty_cycle files (hardware PWM)
+        self.right_duty_file = None
+
+        # Backend-specific motor setters, chosen once so set_*_motor skips
+        # the backend checks on every update
+        self._set_left = self._set_left_sim
+        self._set_right = self._set_right_sim
 
         if not self.simulate:
             if self.backend == 'gpiod':
@@ -118,25 +175,66 @@ class MotorController:
         # Open GPIO chip
         self.chip = gpiod.Chip('/dev/gpiochip4')  # RPi 5 uses gpiochip4
 
-        # Configure all pins as outputs
-        pin_config = {
-            'left_pwm': MOTOR_LEFT_PWM,
-            'left_dir1': MOTOR_LEFT_DIR1,
-            'left_dir2': MOTOR_LEFT_DIR2,
-            'right_pwm': MOTOR_RIGHT_PWM,
-            'right_dir1': MOTOR_RIGHT_DIR1,
-            'right_dir2': MOTOR_RIGHT_DIR2,
-        }
+        # GPIO12/13 are hardware PWM capable - use the kernel PWM if requested
+        hardware_pwm = self.hardware_pwm
+        if hardware_pwm and not (os.path.isdir(PWM_SYSFS_LEFT[0]) and os.path.isdir(PWM_SYSFS_RIGHT[0])):
+            print(f"⚠️  {PWM_SYSFS_LEFT[0]} not found - falling back to software PWM")
+            hardware_pwm = False
+
+        # Each motor's direction pins are requested together so both levels
+        # change in a single set_values() call
+        self._left_bulk = self.chip.get_lines([MOTOR_LEFT_DIR1, MOTOR_LEFT_DIR2])
+        self._left_bulk.request(consumer="motor_controller", type=gpiod.LINE_REQ_DIR_OUT)
+        self._right_bulk = self.chip.get_lines([MOTOR_RIGHT_DIR1, MOTOR_RIGHT_DIR2])
+        self._right_bulk.request(consumer="motor_controller", type=gpiod.LINE_REQ_DIR_OUT)
+
+        # PWM pins are only driven from here for software PWM
+        if not hardware_pwm:
+            for name, pin in (('left_pwm', MOTOR_LEFT_PWM), ('right_pwm', MOTOR_RIGHT_PWM)):
+                line = self.chip.get_line(pin)
+                line.request(consumer="motor_controller", type=gpiod.LINE_REQ_DIR_OUT)
+                self.lines[name] = line
+
+        self._set_left = self._set_left_gpiod
+        self._set_right = self._set_right_gpiod
+
+        if hardware_pwm:
+            self.left_duty_file = self._setup_hardware_pwm(*PWM_SYSFS_LEFT)
+            self.right_duty_file = self._setup_hardware_pwm(*PWM_SYSFS_RIGHT)
+            print("✅ Hardware PWM enabled on GPIO12/13")
+        else:
+            # Start software PWM thread for gpiod
+            self.pwm_running = True
+            self.pwm_thread = threading.Thread(target=self._software_pwm, daemon=True)
+            self.pwm_thread.start()
 
-        for name, pin in pin_config.items():
-            line = self.chip.get_line(pin)
-            line.request(consumer="motor_controller", type=gpiod.LINE_REQ_DIR_OUT)
-            self.lines[name] = line
+    def _setup_hardware_pwm(self, chip_dir: str, channel: int):
+        """
+        Export and enable a kernel PWM channel at PWM_FREQUENCY.
+
+        Args:
+            chip_dir: pwmchip sysfs directory
+            channel: PWM channel number
+
+        Returns:
+            Unbuffered duty_cycle file, kept open for speed updates
+        """
+        channel_dir = os.path.join(chip_dir, f'pwm{channel}')
+        if not os.path.isdir(channel_dir):
+            with open(os.path.join(chip_dir, 'export'), 'w') as f:
+                f.write(str(channel))
+
+        # Duty first - the kernel rejects a period shorter than the duty
+        period_ns = 1_000_000_000 // PWM_FREQUENCY
+        for name, value in (('duty_cycle', 0), ('period', period_ns), ('enable', 1)):
+            with open(os.path.join(channel_dir, name), 'w') as f:
+                f.write(str(value))
+
+        return open(os.path.join(channel_dir, 'duty_cycle'), 'wb', buffering=0)
 
-        # Start software PWM thread for gpiod
-        self.pwm_running = True
-        self.pwm_thread = threading.Thread(target=self._software_pwm, daemon=True)
-        self.pwm_thread.start()
+    def _set_hardware_duty(self, duty_file, speed: float):
+        """Write a duty cycle (0-100%) to a kernel PWM channel - one pwrite() syscall"""
+        os.pwrite(duty_file.fileno(), b'%d' % int(speed * PWM_NS_PER_PERCENT), 0)
 
     def _setup_rpi_gpio(self):
         """Setup GPIO using RPi.GPIO for Raspberry Pi 4/3"""
@@ -161,40 +259,49 @@ class MotorController:
         self.left_pwm.start(0)
         self.right_pwm.start(0)
 
+        self._set_left = self._set_left_rpigpio
+        self._set_right = self._set_right_rpigpio
+
     def _software_pwm(self):
         """Software PWM implementation for gpiod backend"""
-        period = 1.0 / PWM_FREQUENCY  # Period in seconds
-
+        # Run on a dedicated core at real-time priority to cut scheduling jitter.
+        # Best effort - without privileges the thread keeps default scheduling.
+        try:
+            os.sched_setaffinity(0, {PWM_CPU_CORE})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(PWM_RT_PRIORITY))
+        except (AttributeError, OSError) as e:
+            print(f"⚠️  PWM thread not real-time ({e}) - expect more jitter")
+
+        period_ns = 1_000_000_000 // PWM_FREQUENCY
+        left_line = self.lines['left_pwm']
+        right_line = self.lines['right_pwm']
+        period_start = time.monotonic_ns()
+
+        # Both channels share one period: they rise together at the period
+        # start and each falls at its own duty offset. Every edge sleeps until
+        # an absolute deadline, so sleep overshoot never accumulates.
         while self.pwm_running:
-            # Left motor PWM
-            if self.left_pwm_duty > 0:
-                on_time = period * (self.left_pwm_duty / 100.0)
-                off_time = period - on_time
-
-                if on_time > 0:
-                    self.lines['left_pwm'].set_value(1)
-                    time.sleep(on_time)
-                if off_time > 0:
-                    self.lines['left_pwm'].set_value(0)
-                    time.sleep(off_time)
-            else:
-                self.lines['left_pwm'].set_value(0)
-                time.sleep(period)
-
-            # Right motor PWM (interleaved for better performance)
-            if self.right_pwm_duty > 0:
-                on_time = period * (self.right_pwm_duty / 100.0)
-                off_time = period - on_time
-
-                if on_time > 0:
-                    self.lines['right_pwm'].set_value(1)
-                    time.sleep(on_time)
-                if off_time > 0:
-                    self.lines['right_pwm'].set_value(0)
-                    time.sleep(off_time)
+            left_on_ns = int(period_ns * self.left_pwm_duty / 100.0)
+            right_on_ns = int(period_ns * self.right_pwm_duty / 100.0)
+
+            left_line.set_value(1 if left_on_ns > 0 else 0)
+            right_line.set_value(1 if right_on_ns > 0 else 0)
+
+            # Falling edges, earliest first (0% is already low, 100% stays high)
+            edges = sorted(((left_on_ns, left_line), (right_on_ns, right_line)),
+                           key=lambda edge: edge[0])
+            for on_ns, line in edges:
+                if 0 < on_ns < period_ns:
+                    sleep_until_ns(period_start + on_ns)
+                    line.set_value(0)
+
+            # Wait for the next period
+            period_start += period_ns
+            if time.monotonic_ns() - period_start > period_ns:
+                # Fell more than a period behind - resync instead of bursting
+                period_start = time.monotonic_ns()
             else:
-                self.lines['right_pwm'].set_value(0)
-                time.sleep(period)
+                sleep_until_ns(period_start)
 
     def set_left_motor(self, speed: float):
         """
@@ -203,42 +310,7 @@ class MotorController:
         Args:
             speed: Speed from -100 (full reverse) to 100 (full forward)
         """
-        speed = max(-100, min(100, speed))  # Clamp to -100..100
-
-        if self.simulate:
-            if abs(speed) > 1:
-                print(f"LEFT:  {'FWD' if speed > 0 else 'REV'} {abs(speed):3.0f}%", end="  ")
-            return
-
-        if self.backend == 'gpiod':
-            # gpiod backend
-            if speed > 0:  # Forward
-                self.lines['left_dir1'].set_value(1)
-                self.lines['left_dir2'].set_value(0)
-            elif speed < 0:  # Reverse
-                self.lines['left_dir1'].set_value(0)
-                self.lines['left_dir2'].set_value(1)
-            else:  # Stop
-                self.lines['left_dir1'].set_value(0)
-                self.lines['left_dir2'].set_value(0)
-
-            # Update PWM duty cycle
-            self.left_pwm_duty = abs(speed)
-
-        elif self.backend == 'RPi.GPIO':
-            # RPi.GPIO backend
-            if speed > 0:  # Forward
-                GPIO.output(MOTOR_LEFT_DIR1, GPIO.HIGH)
-                GPIO.output(MOTOR_LEFT_DIR2, GPIO.LOW)
-            elif speed < 0:  # Reverse
-                GPIO.output(MOTOR_LEFT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_LEFT_DIR2, GPIO.HIGH)
-            else:  # Stop
-                GPIO.output(MOTOR_LEFT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_LEFT_DIR2, GPIO.LOW)
-
-            # Set speed
-            self.left_pwm.ChangeDutyCycle(abs(speed))
+        self._set_left(max(-100, min(100, speed)))  # Clamp to -100..100
 
     def set_right_motor(self, speed: float):
         """
@@ -247,42 +319,48 @@ class MotorController:
         Args:
             speed: Speed from -100 (full reverse) to 100 (full forward)
         """
-        speed = max(-100, min(100, speed))  # Clamp to -100..100
-
-        if self.simulate:
-            if abs(speed) > 1:
-                print(f"RIGHT: {'FWD' if speed > 0 else 'REV'} {abs(speed):3.0f}%")
-            return
-
-        if self.backend == 'gpiod':
-            # gpiod backend
-            if speed > 0:  # Forward
-                self.lines['right_dir1'].set_value(1)
-                self.lines['right_dir2'].set_value(0)
-            elif speed < 0:  # Reverse
-                self.lines['right_dir1'].set_value(0)
-                self.lines['right_dir2'].set_value(1)
-            else:  # Stop
-                self.lines['right_dir1'].set_value(0)
-                self.lines['right_dir2'].set_value(0)
-
-            # Update PWM duty cycle
+        self._set_right(max(-100, min(100, speed)))  # Clamp to -100..100
+
+    def _set_left_sim(self, speed: float):
+        """Simulated left motor update - speeds are shown on the main status line"""
+
+    def _set_right_sim(self, speed: float):
+        """Simulated right motor update - speeds are shown on the main status line"""
+
+    def _set_left_gpiod(self, speed: float):
+        """Left motor update for the gpiod backend (speed already clamped)"""
+        # Direction from the lookup table - no forward/reverse/stop branches
+        self._left_bulk.set_values(DIR_TABLE[(speed > 0) * 2 + (speed < 0)])
+
+        # Update PWM duty cycle
+        if self.left_duty_file:
+            self._set_hardware_duty(self.left_duty_file, abs(speed))
+        else:
+            self.left_pwm_duty = abs(speed)
+
+    def _set_right_gpiod(self, speed: float):
+        """Right motor update for the gpiod backend (speed already clamped)"""
+        self._right_bulk.set_values(DIR_TABLE[(speed > 0) * 2 + (speed < 0)])
+
+        # Update PWM duty cycle
+        if self.right_duty_file:
+            self._set_hardware_duty(self.right_duty_file, abs(speed))
+        else:
             self.right_pwm_duty = abs(speed)
 
-        elif self.backend == 'RPi.GPIO':
-            # RPi.GPIO backend
-            if speed > 0:  # Forward
-                GPIO.output(MOTOR_RIGHT_DIR1, GPIO.HIGH)
-                GPIO.output(MOTOR_RIGHT_DIR2, GPIO.LOW)
-            elif speed < 0:  # Reverse
-                GPIO.output(MOTOR_RIGHT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_RIGHT_DIR2, GPIO.HIGH)
-            else:  # Stop
-                GPIO.output(MOTOR_RIGHT_DIR1, GPIO.LOW)
-                GPIO.output(MOTOR_RIGHT_DIR2, GPIO.LOW)
-
-            # Set speed
-            self.right_pwm.ChangeDutyCycle(abs(speed))
+    def _set_left_rpigpio(self, speed: float):
+        """Left motor update for the RPi.GPIO backend (speed already clamped)"""
+        GPIO.output([MOTOR_LEFT_DIR1, MOTOR_LEFT_DIR2], DIR_TABLE[(speed > 0) * 2 + (speed < 0)])
+
+        # Set speed
+        self.left_pwm.ChangeDutyCycle(abs(speed))
+
+    def _set_right_rpigpio(self, speed: float):
+        """Right motor update for the RPi.GPIO backend (speed already clamped)"""
+        GPIO.output([MOTOR_RIGHT_DIR1, MOTOR_RIGHT_DIR2], DIR_TABLE[(speed > 0) * 2 + (speed < 0)])
+
+        # Set speed
+        self.right_pwm.ChangeDutyCycle(abs(speed))
 
     def stop(self):
         """Stop both motors"""
@@ -299,7 +377,17 @@ class MotorController:
                 if self.pwm_thread:
                     self.pwm_thread.join(timeout=1.0)
 
+                # Disable hardware PWM
+                for duty_file, (chip_dir, channel) in ((self.left_duty_file, PWM_SYSFS_LEFT),
+                                                       (self.right_duty_file, PWM_SYSFS_RIGHT)):
+                    if duty_file:
+                        duty_file.close()
+                        with open(os.path.join(chip_dir, f'pwm{channel}', 'enable'), 'w') as f:
+                            f.write('0')
+
                 # Release all lines
+                self._left_bulk.release()
+                self._right_bulk.release()
                 for line in self.lines.values():
                     line.release()
 
@@ -338,12 +426,50 @@ class PS3Controller:
         if not self.joystick:
             raise RuntimeError("No PS3 controller found! Please connect PS3 controller.")
 
-        # Controller state
+        # Only queue the events process_events uses - SDL drops the rest
+        # (button releases, hats, mouse/window events) before they reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN])
+
+        self._init_state()
+
+    def _init_state(self):
+        """Reset controller state"""
         self.left_x = 0.0
         self.left_y = 0.0
+        self._smoothed_x = 0.0
+        self._smoothed_y = 0.0
+        self.settling = False  # Smoothed stick still converging on the raw position
+        self._last_t = time.perf_counter()  # Previous smoothed sample, for prediction
+        self._last_x = 0.0
+        self._last_y = 0.0
         self.speed_mode = 'MEDIUM'
         self.precision_mode = False
         self.running = True
+        self.changed = False  # Stick moved or mode changed since last process_events
+        self.gain = 0.0       # Speed scale for the current modes (see update_gain)
+        self.show_status = True  # Print button/mode messages (off with --no-status)
+
+        # Button index -> handler, returning 'STOP'/'RESET'/'EXIT' or None
+        self._btn_handlers = {
+            4: self._slow,       # L1
+            6: self._medium,     # L2
+            5: self._fast,       # R1
+            3: self._estop,      # Triangle
+            0: self._reset,      # Cross
+            1: self._precision,  # Circle
+            9: self._exit,       # Start
+        }
+        self.update_gain()
+
+    def _announce(self, message: str):
+        """Print a mode/button message unless status output is off"""
+        if self.show_status:
+            print(message)
+
+    def update_gain(self):
+        """Recompute the speed gain - call whenever speed_mode or precision_mode changes"""
+        self.gain = SPEED_MODES[self.speed_mode] * (0.5 if self.precision_mode else 1.0)
 
     def apply_dead_zone(self, value: float) -> float:
         """Apply dead zone to joystick value"""
@@ -370,84 +496,282 @@ class PS3Controller:
         }
         return button_names.get(button, f"Button {button}")
 
-    def update(self):
-        """Update controller state"""
-        pygame.event.pump()
+    def handle_button(self, button: int):
+        """
+        Apply a button press.
 
+        Args:
+            button: Button index (pygame numbering, see get_button_name)
+
+        Returns:
+            'STOP', 'RESET' or 'EXIT' for control buttons, otherwise None
+        """
+        handler = self._btn_handlers.get(button)
+        return handler() if handler else None
+
+    # Speed mode buttons
+    def _slow(self):
+        """L1 - Slow"""
+        self.speed_mode = 'SLOW'
+        self.update_gain()
+        self.changed = True
+        self._announce(f"\n🐌 SLOW mode ({SPEED_MODES['SLOW']}%)")
+
+    def _medium(self):
+        """L2 - Medium"""
+        self.speed_mode = 'MEDIUM'
+        self.update_gain()
+        self.changed = True
+        self._announce(f"\n🚶 MEDIUM mode ({SPEED_MODES['MEDIUM']}%)")
+
+    def _fast(self):
+        """R1 - Fast"""
+        self.speed_mode = 'FAST'
+        self.update_gain()
+        self.changed = True
+        self._announce(f"\n🏃 FAST mode ({SPEED_MODES['FAST']}%)")
+
+    # Control buttons
+    def _estop(self):
+        """Triangle - Emergency stop"""
+        self._announce("\n🛑 EMERGENCY STOP!")
+        return 'STOP'
+
+    def _reset(self):
+        """Cross - Reset"""
+        self._announce("\n🔄 Reset")
+        return 'RESET'
+
+    def _precision(self):
+        """Circle - Precision toggle"""
+        self.precision_mode = not self.precision_mode
+        self.update_gain()
+        self.changed = True
+        self._announce(f"\n🎯 Precision mode: {'ON' if self.precision_mode else 'OFF'}")
+
+    def _exit(self):
+        """Start - Exit"""
+        self._announce("\n👋 Exit requested")
+        self.running = False
+        return 'EXIT'
+
+    def _apply_stick(self, raw_x: float, raw_y: float):
+        """
+        Smooth a raw stick reading and extrapolate it into left_x/left_y.
+
+        Sets self.settling while the smoothed values haven't caught up (or are
+        still moving), so the caller keeps updating after the events stop.
+        """
+        alpha = STICK_SMOOTHING
+        self._smoothed_x = alpha * raw_x + (1.0 - alpha) * self._smoothed_x
+        self._smoothed_y = alpha * raw_y + (1.0 - alpha) * self._smoothed_y
+        if abs(self._smoothed_x - raw_x) < STICK_SETTLE_EPSILON:
+            self._smoothed_x = raw_x
+        if abs(self._smoothed_y - raw_y) < STICK_SETTLE_EPSILON:
+            self._smoothed_y = raw_y
+        x = self._smoothed_x
+        y = self._smoothed_y
+
+        # Predict where the stick will be PREDICT_LOOKAHEAD from now. Closely
+        # spaced samples are extrapolated at most one sample ahead, so a burst
+        # of events doesn't amplify noise.
+        now = time.perf_counter()
+        dt = now - self._last_t
+        if 0 < dt < PREDICT_MAX_DT:
+            k = PREDICT_LOOKAHEAD / max(dt, PREDICT_LOOKAHEAD)
+            pred_x = max(-1.0, min(1.0, x + (x - self._last_x) * k))
+            pred_y = max(-1.0, min(1.0, y + (y - self._last_y) * k))
+        else:
+            pred_x, pred_y = x, y
+
+        moving = x != self._last_x or y != self._last_y
+        self._last_t, self._last_x, self._last_y = now, x, y
+        self.settling = x != raw_x or y != raw_y or moving
+
+        self.left_x = self.apply_dead_zone(pred_x)
+        self.left_y = self.apply_dead_zone(pred_y)
+
+    def update(self):
+        """Update controller state (the event queue is drained by process_events)"""
         # Read left stick (axis 0 = X, axis 1 = Y)
-        self.left_x = self.apply_dead_zone(self.joystick.get_axis(0))
-        self.left_y = self.apply_dead_zone(-self.joystick.get_axis(1))  # Invert Y
-
-    def process_events(self):
-        """Process controller events"""
-        for event in pygame.event.get():
-            if event.type == pygame.JOYBUTTONDOWN:
-                button = event.button
-                button_name = self.get_button_name(button)
-
-                # Speed mode buttons
-                if button == 4:  # L1 - Slow
-                    self.speed_mode = 'SLOW'
-                    print(f"\n🐌 SLOW mode ({SPEED_MODES['SLOW']}%)")
-                elif button == 6:  # L2 - Medium
-                    self.speed_mode = 'MEDIUM'
-                    print(f"\n🚶 MEDIUM mode ({SPEED_MODES['MEDIUM']}%)")
-                elif button == 5:  # R1 - Fast
-                    self.speed_mode = 'FAST'
-                    print(f"\n🏃 FAST mode ({SPEED_MODES['FAST']}%)")
-
-                # Control buttons
-                elif button == 3:  # Triangle - Emergency stop
-                    print("\n🛑 EMERGENCY STOP!")
-                    return 'STOP'
-                elif button == 0:  # Cross - Reset
-                    print("\n🔄 Reset")
-                    return 'RESET'
-                elif button == 1:  # Circle - Precision toggle
-                    self.precision_mode = not self.precision_mode
-                    print(f"\n🎯 Precision mode: {'ON' if self.precision_mode else 'OFF'}")
-                elif button == 9:  # Start - Exit
-                    print("\n👋 Exit requested")
-                    self.running = False
-                    return 'EXIT'
+        self._apply_stick(self.joystick.get_axis(0),
+                          -self.joystick.get_axis(1))  # Invert Y
+
+    def process_events(self, timeout_ms: int = 0):
+        """
+        Process controller events, sleeping up to timeout_ms for the first one.
+
+        Sets self.changed when the stick moved or the speed/precision mode changed.
+
+        Args:
+            timeout_ms: Maximum time to block waiting for an event
+
+        Returns:
+            'STOP', 'RESET' or 'EXIT' for control buttons, otherwise None
+        """
+        self.changed = False
+
+        # Sleep in SDL until the controller reports something
+        first = pygame.event.wait(timeout_ms)
+        if first.type == pygame.NOEVENT:
+            return None
+
+        for event in [first] + pygame.event.get():
+            if event.type == pygame.JOYAXISMOTION:
+                if event.axis < 2:  # Left stick only
+                    self.changed = True
+            elif event.type == pygame.JOYBUTTONDOWN:
+                result = self.handle_button(event.button)
+                if result:
+                    return result
+
+        return None
+
+
+class EvdevPS3Controller(PS3Controller):
+    """
+    PS3 controller read directly from its Linux input device with evdev.
+
+    Skips SDL's joystick layer and event queue: one select() + read() per
+    batch of kernel input events. Same interface as PS3Controller.
+    """
+
+    # evdev key codes -> pygame button indices used by handle_button
+    BUTTONS = {
+        ecodes.BTN_SOUTH: 0,   # Cross
+        ecodes.BTN_EAST: 1,    # Circle
+        ecodes.BTN_NORTH: 3,   # Triangle
+        ecodes.BTN_TL: 4,      # L1
+        ecodes.BTN_TR: 5,      # R1
+        ecodes.BTN_TL2: 6,     # L2
+        ecodes.BTN_START: 9,   # Start
+    } if EVDEV_AVAILABLE else {}
+
+    def __init__(self):
+        """Open the PS3 controller's input device"""
+        self.dev = None
+        for path in evdev.list_devices():
+            try:
+                dev = evdev.InputDevice(path)
+            except OSError:
+                continue  # Unreadable/vanished node - not necessarily ours
+
+            if self._is_gamepad(dev):
+                self.dev = dev
+                print(f"✅ PS3 Controller connected (evdev): {dev.name}")
+                break
+            dev.close()
+
+        if not self.dev:
+            raise RuntimeError("No PS3 controller input device found")
+
+        # Axis center and half-range for normalizing raw values to -1..1
+        self._axis_scale = {}
+        self._axis_raw = {}
+        for code in (ecodes.ABS_X, ecodes.ABS_Y):
+            info = self.dev.absinfo(code)
+            self._axis_scale[code] = ((info.max + info.min) / 2.0, (info.max - info.min) / 2.0)
+            self._axis_raw[code] = info.value
+
+        self._init_state()
+
+    @staticmethod
+    def _is_gamepad(dev) -> bool:
+        """
+        True for the PS3 controller's gamepad node. The controller also
+        exposes a "Motion Sensors" node with EV_ABS but no sticks or buttons.
+        """
+        name = dev.name
+        if not ("Sony" in name or "PLAYSTATION" in name or "PS3" in name):
+            return False
+        if "Motion Sensors" in name:
+            return False
+
+        caps = dev.capabilities()
+        abs_codes = {code for code, _ in caps.get(ecodes.EV_ABS, [])}
+        return (ecodes.ABS_X in abs_codes and ecodes.ABS_Y in abs_codes
+                and ecodes.BTN_SOUTH in caps.get(ecodes.EV_KEY, []))
+
+    def _axis(self, code: int) -> float:
+        """Normalized (-1..1) value of a stick axis"""
+        center, half_range = self._axis_scale[code]
+        return max(-1.0, min(1.0, (self._axis_raw[code] - center) / half_range))
+
+    def update(self):
+        """Update controller state from the last axis events"""
+        self._apply_stick(self._axis(ecodes.ABS_X),
+                          -self._axis(ecodes.ABS_Y))  # Invert Y
+
+    def process_events(self, timeout_ms: int = 0):
+        """
+        Process controller events, sleeping up to timeout_ms for the first one.
+
+        Sets self.changed when the stick moved or the speed/precision mode changed.
+
+        Args:
+            timeout_ms: Maximum time to block waiting for an event
+
+        Returns:
+            'STOP', 'RESET' or 'EXIT' for control buttons, otherwise None
+        """
+        self.changed = False
+
+        # Sleep in the kernel until the controller reports something
+        ready, _, _ = select.select([self.dev.fd], [], [], timeout_ms / 1000.0)
+        if not ready:
+            return None
+
+        # read() is a generator - drain it here so its errors are caught
+        try:
+            events = list(self.dev.read())
+        except BlockingIOError:
+            return None  # select() woke us but nothing was left to read
+        except OSError as e:
+            # ENODEV: controller unplugged or out of range - exit so the motors stop
+            print(f"\n❌ Controller disconnected: {e}")
+            self.running = False
+            return 'EXIT'
+
+        for event in events:
+            if event.type == ecodes.EV_ABS:
+                if event.code in self._axis_raw:
+                    self._axis_raw[event.code] = event.value
+                    self.changed = True
+            elif event.type == ecodes.EV_KEY and event.value == 1:  # Key down
+                button = self.BUTTONS.get(event.code)
+                if button is not None:
+                    result = self.handle_button(button)
+                    if result:
+                        return result
 
         return None
 
 
-def calculate_motor_speeds(left_y: float, left_x: float, max_speed: float, precision: bool):
+def needs_update(new_speed: float, sent_speed: float) -> bool:
+    """True if new_speed differs enough from the last written speed to rewrite it"""
+    return abs(new_speed - sent_speed) >= MOTOR_UPDATE_THRESHOLD or (new_speed == 0 and sent_speed != 0)
+
+
+def calculate_motor_speeds(left_y: float, left_x: float, gain: float):
     """
     Calculate motor speeds from joystick input.
 
     Args:
         left_y: Forward/backward (-1 to 1)
         left_x: Left/right turning (-1 to 1)
-        max_speed: Maximum speed percentage (0-100)
-        precision: If True, reduce speed for precision control
+        gain: Speed scale from PS3Controller.gain (max speed, halved in precision mode)
 
     Returns:
         (left_speed, right_speed) tuple
     """
-    # Apply precision mode
-    if precision:
-        left_y *= 0.5
-        left_x *= 0.5
-
     # Tank drive algorithm
     # Forward/backward + turning
     left_speed = left_y + left_x
     right_speed = left_y - left_x
 
-    # Normalize if values exceed -1..1
-    max_val = max(abs(left_speed), abs(right_speed))
-    if max_val > 1.0:
-        left_speed /= max_val
-        right_speed /= max_val
-
-    # Scale to max_speed
-    left_speed *= max_speed
-    right_speed *= max_speed
-
-    return left_speed, right_speed
+    # Normalize if values exceed -1..1 and scale in one step
+    scale = gain / max(1.0, abs(left_speed), abs(right_speed))
+    return left_speed * scale, right_speed * scale
 
 
 def main():
@@ -470,72 +794,111 @@ def main():
     # Check for simulation mode override
     simulate = '--simulate' in sys.argv
 
+    # --no-status skips all per-tick/button terminal output (headless runs)
+    show_status = '--no-status' not in sys.argv
+
     try:
         # Initialize controller
         print("Initializing PS3 controller...")
-        controller = PS3Controller()
+        controller = None
+        if EVDEV_AVAILABLE and '--pygame' not in sys.argv:
+            try:
+                controller = EvdevPS3Controller()
+            except (RuntimeError, OSError) as e:
+                print(f"⚠️  evdev: {e} - falling back to pygame")
+        if controller is None:
+            controller = PS3Controller()
+        controller.show_status = show_status
 
         # Initialize motors
         print("Initializing motor controller...")
-        motors = MotorController(simulate=simulate)
+        motors = MotorController(simulate=simulate, hardware_pwm='--hardware-pwm' in sys.argv)
+
+        # Keep the control loop on its own core, ahead of other processes (best effort)
+        try:
+            os.sched_setaffinity(0, {CONTROL_CPU_CORE})
+            os.nice(CONTROL_NICE)
+        except (AttributeError, OSError) as e:
+            print(f"⚠️  Control loop using default scheduling ({e})")
 
         print("\n✅ System ready! Use PS3 controller to control motors.\n")
 
         # Main control loop
-        last_print = time.time()
+        last_print = time.perf_counter()
         last_left_speed = 0
         last_right_speed = 0
+        left_speed = 0
+        right_speed = 0
+        sent_left_speed = 0    # Last speeds written to the motors
+        sent_right_speed = 0
+
+        # Bind the per-tick callables to locals - each call is then a local
+        # load instead of an attribute or global lookup
+        process_events = controller.process_events
+        update_controller = controller.update
+        calc_speeds = calculate_motor_speeds
+        should_write = needs_update
+        set_left = motors.set_left_motor
+        set_right = motors.set_right_motor
+        perf_counter = time.perf_counter
 
         while controller.running:
-            # Process button events
-            event = controller.process_events()
+            # Wait for controller events - 20 ms max so the status line still updates
+            event = process_events(timeout_ms=20)
 
             if event == 'EXIT':
                 break
             elif event == 'STOP':
                 motors.stop()
+                left_speed = right_speed = 0
+                sent_left_speed = sent_right_speed = 0
                 continue
             elif event == 'RESET':
                 motors.stop()
+                left_speed = right_speed = 0
+                sent_left_speed = sent_right_speed = 0
                 controller.speed_mode = 'MEDIUM'
                 controller.precision_mode = False
+                controller.update_gain()
                 continue
 
-            # Update controller state
-            controller.update()
-
-            # Get max speed for current mode
-            max_speed = SPEED_MODES[controller.speed_mode]
-
-            # Calculate motor speeds
-            left_speed, right_speed = calculate_motor_speeds(
-                controller.left_y,
-                controller.left_x,
-                max_speed,
-                controller.precision_mode
-            )
-
-            # Set motor speeds
-            motors.set_left_motor(left_speed)
-            motors.set_right_motor(right_speed)
-
-            # Print status every 0.1 seconds (if changed)
-            if time.time() - last_print > 0.1:
+            # Only recompute when the stick or mode changed (or smoothing hasn't settled)
+            if controller.changed or controller.settling:
+                # Update controller state
+                update_controller()
+
+                # Calculate motor speeds
+                left_speed, right_speed = calc_speeds(
+                    controller.left_y,
+                    controller.left_x,
+                    controller.gain
+                )
+
+                # Set motor speeds - skip changes below MOTOR_UPDATE_THRESHOLD
+                if should_write(left_speed, sent_left_speed):
+                    set_left(left_speed)
+                    sent_left_speed = left_speed
+                if should_write(right_speed, sent_right_speed):
+                    set_right(right_speed)
+                    sent_right_speed = right_speed
+
+            # Print status every STATUS_INTERVAL seconds (if changed)
+            if not show_status:
+                continue
+            now = perf_counter()
+            if now - last_print > STATUS_INTERVAL:
                 if abs(left_speed - last_left_speed) > 1 or abs(right_speed - last_right_speed) > 1:
-                    mode_indicator = "🎯" if controller.precision_mode else ""
-                    print(f"\r{mode_indicator} Mode: {controller.speed_mode:6} | "
-                          f"Stick: ({controller.left_x:+5.2f}, {controller.left_y:+5.2f}) | ", end="")
-
-                    if not simulate:
-                        print(f"L: {left_speed:+6.1f}% | R: {right_speed:+6.1f}%   ", end="")
+                    status = STATUS_TEMPLATE % ("🎯" if controller.precision_mode else "",
+                                                controller.speed_mode,
+                                                controller.left_x, controller.left_y,
+                                                left_speed, right_speed)
+                    sys.stdout.write(status)
+                    sys.stdout.flush()
 
                     last_left_speed = left_speed
                     last_right_speed = right_speed
 
-                last_print = time.time()
-
-            # Small delay to prevent CPU overload
-            time.sleep(0.02)  # 50 Hz update rate
+                last_print = now
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
@@ -548,6 +911,8 @@ def main():
         print("\n\nCleaning up...")
         if 'motors' in locals():
             motors.cleanup()
+        if isinstance(locals().get('controller'), EvdevPS3Controller):
+            controller.dev.close()
         pygame.quit()
         print("✅ Cleanup complete")
         print("\nGoodbye! 👋\n")
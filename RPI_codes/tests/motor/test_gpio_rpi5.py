@@ -6,7 +6,10 @@ Quick test to verify motor connections are working.
 """
 
 import sys
-import time
+import os
+import select
+import termios
+import tty
 
 print("\n" + "=" * 50)
 print("SIMPLE MOTOR CONNECTION TEST")
@@ -36,24 +39,47 @@ RIGHT_PWM = 13
 RIGHT_DIR1 = 19
 RIGHT_DIR2 = 26
 
+STEP_SECONDS = 1.5  # How long each test step runs
+
+
+def wait_for_step(seconds):
+    """
+    Hold the current test step for up to `seconds`.
+
+    Returns:
+        str: Key pressed to end the step early, or empty string on timeout
+    """
+    ready, _, _ = select.select([sys.stdin], [], [], seconds)
+    if not ready:
+        return ''
+    return os.read(sys.stdin.fileno(), 1).decode('ascii', 'ignore').lower()
+
+
 print(f"\nPins: Left(12,16,20) Right(13,19,26)")
-print("\nPress ENTER to start test...", end='')
+print("\nPress ENTER to start test (any key skips a step, Q aborts)...", end='')
 input()
 
-lines = {}
+# Single keypresses without ENTER during the test
+old_term = None
+if sys.stdin.isatty():
+    old_term = termios.tcgetattr(sys.stdin)
+    tty.setcbreak(sys.stdin.fileno())
+
+left_bulk = None   # gpiod (dir1, dir2, pwm) lines per motor
+right_bulk = None
 
 try:
     # Setup GPIO
     if GPIO_BACKEND == 'gpiod':
-        # Simple gpiod setup
-        for name, pin in [('l_pwm', LEFT_PWM), ('l_d1', LEFT_DIR1), ('l_d2', LEFT_DIR2),
-                          ('r_pwm', RIGHT_PWM), ('r_d1', RIGHT_DIR1), ('r_d2', RIGHT_DIR2)]:
-            line = gpiod.find_line(f"GPIO{pin}")
-            if line is None:
-                # Fallback: try direct chip access
-                line = gpiod.Chip('gpiochip4').get_line(pin)
-            line.request(consumer="test", type=gpiod.LINE_REQ_DIR_OUT)
-            lines[name] = line
+        # Find the chip that owns the header pins
+        line = gpiod.find_line(f"GPIO{LEFT_PWM}")
+        chip = line.owner() if line is not None else gpiod.Chip('gpiochip4')
+
+        # Request each motor's three pins together - one set_values() per step
+        left_bulk = chip.get_lines([LEFT_DIR1, LEFT_DIR2, LEFT_PWM])
+        left_bulk.request(consumer="test", type=gpiod.LINE_REQ_DIR_OUT)
+        right_bulk = chip.get_lines([RIGHT_DIR1, RIGHT_DIR2, RIGHT_PWM])
+        right_bulk.request(consumer="test", type=gpiod.LINE_REQ_DIR_OUT)
     else:
         GPIO.setmode(GPIO.BCM)
         GPIO.setwarnings(False)
@@ -76,13 +102,9 @@ try:
 
         if GPIO_BACKEND == 'gpiod':
             if motor in ['l', 'b']:
-                lines['l_d1'].set_value(d1)
-                lines['l_d2'].set_value(d2)
-                lines['l_pwm'].set_value(pwm)
+                left_bulk.set_values([d1, d2, pwm])
             if motor in ['r', 'b']:
-                lines['r_d1'].set_value(d1)
-                lines['r_d2'].set_value(d2)
-                lines['r_pwm'].set_value(pwm)
+                right_bulk.set_values([d1, d2, pwm])
         else:
             if motor in ['l', 'b']:
                 GPIO.output(LEFT_DIR1, d1)
@@ -93,14 +115,17 @@ try:
                 GPIO.output(RIGHT_DIR2, d2)
                 GPIO.output(RIGHT_PWM, pwm)
 
-        time.sleep(1.5)
-        print("Done")
+        key = wait_for_step(STEP_SECONDS)
+        if key in ('q', '\x1b'):
+            print("Aborted")
+            break
+        print("Skipped" if key else "Done")
 
     # Stop all
     print("\n→ Stopping all motors...")
     if GPIO_BACKEND == 'gpiod':
-        for line in lines.values():
-            line.set_value(0)
+        left_bulk.set_values([0, 0, 0])
+        right_bulk.set_values([0, 0, 0])
     else:
         GPIO.output([LEFT_DIR1, LEFT_DIR2, LEFT_PWM, RIGHT_DIR1, RIGHT_DIR2, RIGHT_PWM], 0)
 
@@ -123,10 +148,13 @@ except Exception as e:
 
 finally:
     # Cleanup
+    if old_term is not None:
+        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_term)
     print("\nCleaning up...", end=' ')
-    if GPIO_BACKEND == 'gpiod' and lines:
-        for line in lines.values():
-            line.release()
+    if GPIO_BACKEND == 'gpiod':
+        for bulk in (left_bulk, right_bulk):
+            if bulk is not None:
+                bulk.release()
     elif GPIO_BACKEND == 'RPi.GPIO':
         GPIO.cleanup()
     print("Done\n")
@@ -4,95 +4,62 @@
 Dead Simple Motor Test - L298N
 """
 
-import lgpio
 import time
 
-print("\n=== SIMPLE MOTOR TEST ===\n")
-
-# Motor pins
-L_PWM, L_D1, L_D2 = 12, 16, 20  # Left motor
-R_PWM, R_D1, R_D2 = 13, 19, 26  # Right motor
-
-# Open GPIO chip
-h = lgpio.gpiochip_open(4)
+from _rig import motor_rig
 
-# Set all pins as outputs
-for pin in [L_PWM, L_D1, L_D2, R_PWM, R_D1, R_D2]:
-    lgpio.gpio_claim_output(h, pin)
+print("\n=== SIMPLE MOTOR TEST ===\n")
 
 print("Press ENTER to start...", end='')
 input()
 print()
 
-try:
-    # Left forward
-    print("Left forward...")
-    lgpio.gpio_write(h, L_D1, 1)
-    lgpio.gpio_write(h, L_D2, 0)
-    lgpio.gpio_write(h, L_PWM, 1)
-    time.sleep(2)
-    lgpio.gpio_write(h, L_PWM, 0)
-    time.sleep(0.5)
-    
-    # Left reverse
-    print("Left reverse...")
-    lgpio.gpio_write(h, L_D1, 0)
-    lgpio.gpio_write(h, L_D2, 1)
-    lgpio.gpio_write(h, L_PWM, 1)
-    time.sleep(2)
-    lgpio.gpio_write(h, L_PWM, 0)
-    time.sleep(0.5)
-    
-    # Right forward
-    print("Right forward...")
-    lgpio.gpio_write(h, R_D1, 1)
-    lgpio.gpio_write(h, R_D2, 0)
-    lgpio.gpio_write(h, R_PWM, 1)
-    time.sleep(2)
-    lgpio.gpio_write(h, R_PWM, 0)
-    time.sleep(0.5)
-    
-    # Right reverse
-    print("Right reverse...")
-    lgpio.gpio_write(h, R_D1, 0)
-    lgpio.gpio_write(h, R_D2, 1)
-    lgpio.gpio_write(h, R_PWM, 1)
-    time.sleep(2)
-    lgpio.gpio_write(h, R_PWM, 0)
-    time.sleep(0.5)
-    
-    # Both forward (straight)
-    print("Straight forward...")
-    lgpio.gpio_write(h, L_D1, 1)
-    lgpio.gpio_write(h, L_D2, 0)
-    lgpio.gpio_write(h, R_D1, 1)
-    lgpio.gpio_write(h, R_D2, 0)
-    lgpio.gpio_write(h, L_PWM, 1)
-    lgpio.gpio_write(h, R_PWM, 1)
-    time.sleep(2)
-    lgpio.gpio_write(h, L_PWM, 0)
-    lgpio.gpio_write(h, R_PWM, 0)
-    time.sleep(0.5)
-    
-    # Both reverse (straight back)
-    print("Straight back...")
-    lgpio.gpio_write(h, L_D1, 0)
-    lgpio.gpio_write(h, L_D2, 1)
-    lgpio.gpio_write(h, R_D1, 0)
-    lgpio.gpio_write(h, R_D2, 1)
-    lgpio.gpio_write(h, L_PWM, 1)
-    lgpio.gpio_write(h, R_PWM, 1)
-    time.sleep(2)
-    lgpio.gpio_write(h, L_PWM, 0)
-    lgpio.gpio_write(h, R_PWM, 0)
-    
-    print("\n✅ Done! Did motors work?\n")
+with motor_rig() as rig:
+    try:
+        # Left forward
+        print("Left forward...")
+        rig.set('left', 'forward', 100)
+        time.sleep(2)
+        rig.set('left', 'stop', 0)
+        time.sleep(0.5)
+
+        # Left reverse
+        print("Left reverse...")
+        rig.set('left', 'reverse', 100)
+        time.sleep(2)
+        rig.set('left', 'stop', 0)
+        time.sleep(0.5)
+
+        # Right forward
+        print("Right forward...")
+        rig.set('right', 'forward', 100)
+        time.sleep(2)
+        rig.set('right', 'stop', 0)
+        time.sleep(0.5)
+
+        # Right reverse
+        print("Right reverse...")
+        rig.set('right', 'reverse', 100)
+        time.sleep(2)
+        rig.set('right', 'stop', 0)
+        time.sleep(0.5)
+
+        # Both forward (straight)
+        print("Straight forward...")
+        rig.set('left', 'forward', 100)
+        rig.set('right', 'forward', 100)
+        time.sleep(2)
+        rig.stop()
+        time.sleep(0.5)
+
+        # Both reverse (straight back)
+        print("Straight back...")
+        rig.set('left', 'reverse', 100)
+        rig.set('right', 'reverse', 100)
+        time.sleep(2)
+        rig.stop()
 
-except KeyboardInterrupt:
-    print("\nStopped")
+        print("\n✅ Done! Did motors work?\n")
 
-finally:
-    # Stop everything
-    for pin in [L_PWM, L_D1, L_D2, R_PWM, R_D1, R_D2]:
-        lgpio.gpio_write(h, pin, 0)
-    lgpio.gpiochip_close(h)
\ No newline at end of file
+    except KeyboardInterrupt:
+        print("\nStopped")
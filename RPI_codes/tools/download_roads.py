@@ -6,20 +6,319 @@ Downloads road data from OpenStreetMap and saves as GeoJSON.
 """
 
 import argparse
+import array
+import gzip
+import hashlib
+import io
 import json
+import mmap
+import shutil
 import sys
 import os
-from typing import Optional
+import time
+from collections import Counter
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests module not installed")
     print("Install with: pip install requests")
     sys.exit(1)
 
+# ijson parses the Overpass response incrementally (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _RESPONSE_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _RESPONSE_JSON_ERRORS = (json.JSONDecodeError,)
+
+# orjson (de)serializes several times faster than json (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+    def _dumps(obj) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return orjson.dumps(obj)
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+    def _dumps(obj) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# numpy is only needed for the --npz array export (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# Overpass geometry point -> (lon, lat) in one C-level call
+_LON_LAT = itemgetter('lon', 'lat')
+
+
+def _make_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all Overpass requests.
+
+    Keeps the TCP/TLS connection alive between requests, requests gzip
+    responses and retries rate-limit (429) and gateway errors with
+    exponential backoff.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=1,
+                  status_forcelist=[429, 502, 503, 504],
+                  allowed_methods=frozenset(['GET', 'POST']))
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    # Ask for a compressed response explicitly (some proxies drop the
+    # default header); requests/urllib3 decompress it transparently
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': 'GIQ-RoadDownloader/1.0'
+    })
+    return session
+
+
+_SESSION = _make_session()
+
+
+def _element_to_feature(element: dict) -> Optional[dict]:
+    """
+    Convert an Overpass way element to a GeoJSON LineString feature.
+
+    Args:
+        element: Overpass element (with 'geometry' from `out geom`)
+
+    Returns:
+        GeoJSON feature dict, or None if the element isn't a usable way
+    """
+    if element.get('type') != 'way':
+        return None
+
+    if 'geometry' not in element:
+        return None
+
+    # Extract coordinates (OSM is [lat, lon], GeoJSON needs [lon, lat]).
+    # Tuples serialize as JSON arrays.
+    coordinates = list(map(_LON_LAT, element['geometry']))
+
+    if len(coordinates) < 2:
+        return None
+
+    # Extract properties
+    tags = element.get('tags', {})
+    properties = {
+        'osm_id': element.get('id'),
+        'name': tags.get('name', 'Unnamed Road'),
+        'highway': tags.get('highway', 'unknown'),
+        'surface': tags.get('surface', 'unknown'),
+        'lanes': tags.get('lanes', '1'),
+        'oneway': tags.get('oneway', 'no')
+    }
+
+    # Create GeoJSON feature
+    return {
+        'type': 'Feature',
+        'geometry': {
+            'type': 'LineString',
+            'coordinates': coordinates
+        },
+        'properties': properties
+    }
+
+
+# Road types to download (major roads through residential)
+HIGHWAY_FILTER = "motorway|trunk|primary|secondary|tertiary|unclassified|residential"
+
+# Output write buffer - each feature is a small write, so batch them into
+# large writes (fewer syscalls on the Pi's SD card)
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Outputs ending in .gz are gzip-compressed. Level 1 is cheap on the Pi and
+# still shrinks the repetitive GeoJSON keys by ~10x.
+GZIP_COMPRESSLEVEL = 1
+
+# Local cache of downloaded road files - repeat runs skip the Overpass request
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'giq', 'overpass')
+CACHE_TTL_SECONDS = 7 * 24 * 3600  # Road data rarely changes; refresh weekly
+
+
+def _cache_path(points: List[Tuple[float, float]], radius: int) -> str:
+    """
+    Cache file for a query. Coordinates are rounded to 4 decimals (~11 m)
+    so repeated runs from nearly the same spot share an entry.
+    """
+    key = f"{HIGHWAY_FILTER}|{radius}|" + ";".join(f"{lat:.4f},{lon:.4f}" for lat, lon in points)
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.geojson')
+
+
+def _load_from_cache(cache_file: str, output_file: str) -> bool:
+    """Copy a fresh cache entry to output_file. Returns True on a cache hit."""
+    try:
+        if time.time() - os.path.getmtime(cache_file) > CACHE_TTL_SECONDS:
+            return False
+        shutil.copyfile(cache_file, output_file)
+    except OSError:
+        return False
+
+    print(f"✅ Using cached roads ({cache_file})")
+    return True
+
+
+def _save_to_cache(output_file: str, cache_file: str):
+    """Store a downloaded file in the cache (failures only warn)"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        shutil.copyfile(output_file, cache_file)
+    except OSError as e:
+        print(f"⚠️  Could not cache roads: {e}")
+
+
+def _open_output(path: str, compressed: bool):
+    """Open a binary output file, buffered and optionally gzip-compressed"""
+    if compressed:
+        return io.BufferedWriter(gzip.open(path, 'wb', compresslevel=GZIP_COMPRESSLEVEL),
+                                 buffer_size=OUTPUT_BUFFER_SIZE)
+    return open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
+
+
+def _open_geojson(filepath: str):
+    """Open a GeoJSON file for reading text, transparently gunzipping .gz files"""
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, 'rt', encoding='utf-8')
+    return open(filepath, 'r')
+
+
+class _RoadArrays:
+    """
+    Roads collected as flat arrays (structure of arrays) for the .npz export.
+
+    Way i covers coords[offsets[i]:offsets[i + 1]], stored as (lat, lon)
+    rows like RoadFinder uses. Strings are saved as fixed-width unicode
+    arrays so the file loads without pickle.
+    """
+
+    def __init__(self):
+        self.coords = array.array('d')  # lat0, lon0, lat1, lon1, ...
+        self.offsets = array.array('q', [0])
+        self.osm_ids = array.array('q')
+        self.highways = []
+        self.names = []
+
+    def add(self, feature: dict):
+        """Append one GeoJSON LineString feature"""
+        coords = self.coords
+        for lon, lat in feature['geometry']['coordinates']:
+            coords.append(lat)
+            coords.append(lon)
+        self.offsets.append(len(coords) // 2)
+
+        props = feature['properties']
+        self.osm_ids.append(props.get('osm_id') or 0)
+        self.highways.append(props.get('highway', 'unknown'))
+        self.names.append(props.get('name', 'Unnamed Road'))
+
+    def save(self, filepath: str):
+        """Write the arrays to an uncompressed .npz file"""
+        np.savez(
+            filepath,
+            coords=np.frombuffer(self.coords, dtype=np.float64).reshape(-1, 2),
+            offsets=np.frombuffer(self.offsets, dtype=np.int64),
+            osm_id=np.frombuffer(self.osm_ids, dtype=np.int64),
+            highway=np.array(self.highways, dtype=str),
+            name=np.array(self.names, dtype=str)
+        )
+        print(f"✅ Saved {len(self.names)} roads as arrays to {filepath}")
+
+
+def _load_geojson(filepath: str) -> dict:
+    """
+    Parse a (possibly gzipped) GeoJSON file.
+
+    With orjson, plain files are memory-mapped and parsed in place instead
+    of being read into a Python string first.
+    """
+    if not ORJSON_AVAILABLE:
+        with _open_geojson(filepath) as f:
+            return json.load(f)
+
+    if filepath.endswith('.gz'):
+        with gzip.open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b'')  # mmap can't map an empty file
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _stream_elements(raw, status: dict):
+    """
+    Yield Overpass elements one at a time from a streamed response.
+
+    Also records in status whether the top-level 'elements' array was seen
+    and any top-level 'remark' (Overpass reports runtime errors/timeouts
+    there, usually after a truncated or missing element list).
+    """
+    builder = None
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'elements.item' and event == 'end_map':
+                yield builder.value
+                builder = None
+        elif prefix == 'elements.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == '' and event == 'map_key' and value == 'elements':
+            status['elements'] = True
+        elif prefix == 'remark' and event == 'string':
+            status['remark'] = value
+
+
+def _build_query(points: List[Tuple[float, float]], radius: int, timeout: int = 60) -> str:
+    """
+    Build an Overpass query for roads around one or more points.
+
+    All points go into a single union block, so the server returns the
+    combined (already de-duplicated) set of ways in one response.
+
+    Args:
+        points: (lat, lon) centers
+        radius: Radius in meters around each point
+        timeout: Server-side query timeout in seconds
+
+    Returns:
+        Overpass QL query string
+    """
+    clauses = "".join(
+        f'''
+      way["highway"~"{HIGHWAY_FILTER}"]
+          (around:{radius},{lat},{lon});'''
+        for lat, lon in points
+    )
+    return f"""
+    [out:json][timeout:{timeout}];
+    ({clauses}
+    );
+    out geom;
+    """
+
 
-def download_roads(lat: float, lon: float, radius: int = 500, output_file: str = "roads.geojson") -> bool:
+def download_roads(lat: float, lon: float, radius: int = 500, output_file: str = "roads.geojson",
+                   use_cache: bool = True, npz_file: Optional[str] = None) -> Optional[dict]:
     """
     Download roads from OpenStreetMap Overpass API.
 
@@ -28,183 +327,288 @@ def download_roads(lat: float, lon: float, radius: int = 500, output_file: str =
         lon: Center longitude
         radius: Radius in meters to search for roads
         output_file: Output GeoJSON file path
+        use_cache: Reuse a recent download of the same area (see CACHE_DIR)
+        npz_file: Also save the roads as flat numpy arrays (see _RoadArrays)
 
     Returns:
-        True if successful, False otherwise
+        Road summary (see summarize_geojson), or None on failure
     """
     print(f"Downloading roads around ({lat}, {lon}) within {radius}m...")
 
-    # Overpass API query for roads
-    overpass_url = "https://overpass-api.de/api/interpreter"
+    metadata = {
+        'center': [lat, lon],
+        'radius_meters': radius
+    }
+    cache_file = _cache_path([(lat, lon)], radius) if use_cache else None
+    return _download(_build_query([(lat, lon)], radius), output_file, metadata, cache_file, npz_file)
 
-    # Query for major roads (primary, secondary, tertiary, residential)
-    query = f"""
-    [out:json][timeout:60];
-    (
-      way["highway"~"motorway|trunk|primary|secondary|tertiary|unclassified|residential"]
-          (around:{radius},{lat},{lon});
-    );
-    out geom;
+
+def download_roads_multi(points: List[Tuple[float, float]], radius: int = 500,
+                         output_file: str = "roads.geojson", use_cache: bool = True,
+                         npz_file: Optional[str] = None) -> Optional[dict]:
     """
+    Download roads around several points (e.g. route waypoints) in one request.
 
-    try:
-        print("Sending request to Overpass API...")
-        response = requests.post(overpass_url, data={'data': query}, timeout=120)
+    Args:
+        points: (lat, lon) centers
+        radius: Radius in meters around each point
+        output_file: Output GeoJSON file path
+        use_cache: Reuse a recent download of the same area (see CACHE_DIR)
+        npz_file: Also save the roads as flat numpy arrays (see _RoadArrays)
 
-        if response.status_code != 200:
-            print(f"❌ Error: API returned status {response.status_code}")
-            return False
+    Returns:
+        Road summary (see summarize_geojson), or None on failure
+    """
+    print(f"Downloading roads around {len(points)} points within {radius}m...")
 
-        print("✅ Data received, processing...")
+    metadata = {
+        'points': [[lat, lon] for lat, lon in points],
+        'radius_meters': radius
+    }
+    # Larger unions take longer on the server
+    timeout = min(180, 60 + 10 * len(points))
+    cache_file = _cache_path(points, radius) if use_cache else None
+    return _download(_build_query(points, radius, timeout), output_file, metadata, cache_file, npz_file)
 
-        # Parse OSM data
-        osm_data = response.json()
 
-        if 'elements' not in osm_data:
-            print("❌ Error: No elements in response")
-            return False
+def _download(query: str, output_file: str, metadata: dict, cache_file: Optional[str] = None,
+              npz_file: Optional[str] = None) -> Optional[dict]:
+    """
+    Run an Overpass query and stream the roads to a GeoJSON file.
+
+    Args:
+        query: Overpass QL query (see _build_query)
+        output_file: Output GeoJSON file path
+        metadata: FeatureCollection metadata (road_count is added)
+        cache_file: Cache entry to reuse/refresh, or None to always download
+        npz_file: Also save the roads as flat numpy arrays, or None
+
+    Returns:
+        Road summary (see summarize_geojson), or None on failure
+    """
+    compressed = output_file.endswith('.gz')
+    if cache_file and compressed:
+        cache_file += '.gz'  # Keep compressed and plain entries apart
+
+    if cache_file and _load_from_cache(cache_file, output_file):
+        data = _load_geojson(output_file)
+        if npz_file:
+            arrays = _RoadArrays()
+            for feature in data['features']:
+                arrays.add(feature)
+            arrays.save(npz_file)
+        return summarize_geojson(data)
 
-        # Convert to GeoJSON
-        features = []
-
-        for element in osm_data['elements']:
-            if element['type'] != 'way':
-                continue
-
-            if 'geometry' not in element:
-                continue
-
-            # Extract coordinates (OSM is [lat, lon], GeoJSON needs [lon, lat])
-            coordinates = [[point['lon'], point['lat']] for point in element['geometry']]
-
-            if len(coordinates) < 2:
-                continue
-
-            # Extract properties
-            tags = element.get('tags', {})
-            properties = {
-                'osm_id': element.get('id'),
-                'name': tags.get('name', 'Unnamed Road'),
-                'highway': tags.get('highway', 'unknown'),
-                'surface': tags.get('surface', 'unknown'),
-                'lanes': tags.get('lanes', '1'),
-                'oneway': tags.get('oneway', 'no')
-            }
-
-            # Create GeoJSON feature
-            feature = {
-                'type': 'Feature',
-                'geometry': {
-                    'type': 'LineString',
-                    'coordinates': coordinates
-                },
-                'properties': properties
-            }
-
-            features.append(feature)
-
-        # Create GeoJSON FeatureCollection
-        geojson = {
-            'type': 'FeatureCollection',
-            'features': features,
-            'metadata': {
-                'center': [lat, lon],
-                'radius_meters': radius,
-                'road_count': len(features)
-            }
-        }
-
-        # Save to file
-        print(f"Writing {len(features)} roads to {output_file}...")
-        with open(output_file, 'w') as f:
-            json.dump(geojson, f, indent=2)
-
-        print(f"✅ Successfully saved {len(features)} roads to {output_file}")
-        return True
+    try:
+        print("Sending request to Overpass API...")
+        response = _SESSION.post(OVERPASS_URL, data={'data': query}, timeout=120, stream=True)
+
+        if response.status_code != 200:
+            print(f"❌ Error: API returned status {response.status_code}")
+            return None
+
+        # Filled in while parsing: was 'elements' present, and any 'remark'
+        status = {'elements': False, 'remark': None}
+
+        if IJSON_AVAILABLE:
+            # Parse one element at a time straight off the socket
+            print("✅ Connected, streaming data...")
+            response.raw.decode_content = True
+            elements = _stream_elements(response.raw, status)
+        else:
+            print("✅ Data received, processing...")
+            osm_data = response.json()
+
+            if 'elements' not in osm_data:
+                print("❌ Error: No elements in response")
+                return None
+
+            status['elements'] = True
+            status['remark'] = osm_data.get('remark')
+            elements = osm_data['elements']
+
+        # Write each feature as soon as it is converted - the full
+        # FeatureCollection is never held in memory. Written to a temporary
+        # file first so a failed download doesn't leave a truncated output.
+        print(f"Writing roads to {output_file}...")
+        road_count = 0
+        summary = _new_summary(metadata)
+        arrays = _RoadArrays() if npz_file else None
+        tmp_file = output_file + '.part'
+        try:
+            with _open_output(tmp_file, compressed) as f:
+                f.write(b'{"type":"FeatureCollection","features":[')
+
+                seen_ids = set()
+                for element in elements:
+                    feature = _element_to_feature(element)
+                    if feature is None:
+                        continue
+
+                    # Skip ways already written (overlapping query areas)
+                    osm_id = feature['properties']['osm_id']
+                    if osm_id in seen_ids:
+                        continue
+                    seen_ids.add(osm_id)
+
+                    if road_count:
+                        f.write(b',')
+                    f.write(_dumps(feature))
+                    road_count += 1
+                    _add_to_summary(summary, feature)
+                    if arrays is not None:
+                        arrays.add(feature)
+
+                f.write(b'],"metadata":')
+                f.write(_dumps(dict(metadata, road_count=road_count)))
+                f.write(b'}')
+
+            # Streaming can only tell once the whole response is read
+            if not status['elements']:
+                print("❌ Error: No elements in response")
+                return None
+            if status['remark']:
+                print(f"❌ Error: Overpass reported: {status['remark']}")
+                return None
+
+            os.replace(tmp_file, output_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+        print(f"✅ Successfully saved {road_count} roads to {output_file}")
+        if arrays is not None:
+            arrays.save(npz_file)
+        if cache_file and road_count:
+            _save_to_cache(output_file, cache_file)
+        elif cache_file:
+            print("⚠️  No roads found - not caching this result")
+        return summary
 
     except requests.exceptions.Timeout:
         print("❌ Error: Request timeout. Try again or reduce radius.")
-        return False
+        return None
     except requests.exceptions.RequestException as e:
         print(f"❌ Error: Network error: {e}")
-        return False
-    except json.JSONDecodeError as e:
+        return None
+    except _RESPONSE_JSON_ERRORS as e:
         print(f"❌ Error: Invalid JSON response: {e}")
-        return False
+        return None
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
-        return False
+        return None
 
 
-def validate_geojson(filepath: str):
+def _new_summary(metadata: dict) -> dict:
+    """Empty road summary, filled in by _add_to_summary"""
+    return {
+        'metadata': metadata,
+        'road_count': 0,
+        'named_roads': 0,
+        'road_types': Counter(),
+        'samples': []
+    }
+
+
+# Number of roads shown in the summary printout
+SUMMARY_SAMPLE_COUNT = 5
+
+
+def _add_to_summary(summary: dict, feature: dict):
+    """Count one GeoJSON road feature into a summary"""
+    props = feature.get('properties', {})
+    summary['road_types'][props.get('highway', 'unknown')] += 1
+
+    if props.get('name') and props.get('name') != 'Unnamed Road':
+        summary['named_roads'] += 1
+
+    if len(summary['samples']) < SUMMARY_SAMPLE_COUNT:
+        summary['samples'].append(feature)
+    summary['road_count'] += 1
+
+
+def summarize_geojson(data: dict) -> dict:
     """
-    Validate and display GeoJSON file contents.
+    Summarize a road FeatureCollection.
 
     Args:
-        filepath: Path to GeoJSON file
+        data: Parsed GeoJSON FeatureCollection
+
+    Returns:
+        Dict with metadata, road_count, named_roads, road_types
+        (Counter of highway types) and the first few features as samples
     """
-    try:
-        print(f"\nValidating {filepath}...")
+    features = data.get('features', [])
+    props = [feature.get('properties', {}) for feature in features]
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+    # Counted in bulk rather than through _add_to_summary per feature
+    summary = _new_summary(data.get('metadata', {}))
+    summary['road_count'] = len(features)
+    summary['road_types'] = Counter(p.get('highway', 'unknown') for p in props)
+    summary['named_roads'] = sum(1 for p in props if p.get('name') and p.get('name') != 'Unnamed Road')
+    summary['samples'] = features[:SUMMARY_SAMPLE_COUNT]
+    return summary
 
-        if data.get('type') != 'FeatureCollection':
-            print("❌ Error: Not a valid FeatureCollection")
-            return
 
-        features = data.get('features', [])
-        metadata = data.get('metadata', {})
+def _print_summary(summary: dict):
+    """Display a road summary (see summarize_geojson)"""
+    metadata = summary['metadata']
 
-        print("\n" + "=" * 60)
-        print("GeoJSON File Summary")
-        print("=" * 60)
+    print("\n" + "=" * 60)
+    print("GeoJSON File Summary")
+    print("=" * 60)
 
-        if metadata:
-            print(f"Center: {metadata.get('center', 'N/A')}")
-            print(f"Radius: {metadata.get('radius_meters', 'N/A')}m")
+    if metadata:
+        print(f"Center: {metadata.get('center', 'N/A')}")
+        print(f"Radius: {metadata.get('radius_meters', 'N/A')}m")
 
-        print(f"Total Roads: {len(features)}")
+    print(f"Total Roads: {summary['road_count']}")
+    print(f"Named Roads: {summary['named_roads']}")
 
-        # Count road types
-        road_types = {}
-        named_roads = 0
+    print("\nRoad Types:")
+    for road_type, count in summary['road_types'].most_common():
+        print(f"  {road_type}: {count}")
 
-        for feature in features:
-            props = feature.get('properties', {})
-            highway_type = props.get('highway', 'unknown')
-            road_types[highway_type] = road_types.get(highway_type, 0) + 1
+    print("\n" + "=" * 60)
 
-            if props.get('name') and props.get('name') != 'Unnamed Road':
-                named_roads += 1
+    # Display first few roads
+    print("\nSample Roads:")
+    for i, feature in enumerate(summary['samples']):
+        props = feature.get('properties', {})
+        coords = feature.get('geometry', {}).get('coordinates', [])
+        print(f"\n{i+1}. {props.get('name', 'Unnamed')}")
+        print(f"   Type: {props.get('highway', 'unknown')}")
+        print(f"   Points: {len(coords)}")
+        if coords:
+            print(f"   Start: {coords[0]}")
+            print(f"   End: {coords[-1]}")
 
-        print(f"Named Roads: {named_roads}")
 
-        print("\nRoad Types:")
-        for road_type, count in sorted(road_types.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {road_type}: {count}")
+def validate_geojson(filepath: str):
+    """
+    Validate and display GeoJSON file contents.
 
-        print("\n" + "=" * 60)
+    Args:
+        filepath: Path to GeoJSON file
+    """
+    try:
+        print(f"\nValidating {filepath}...")
 
-        # Display first few roads
-        print("\nSample Roads:")
-        for i, feature in enumerate(features[:5]):
-            props = feature.get('properties', {})
-            coords = feature.get('geometry', {}).get('coordinates', [])
-            print(f"\n{i+1}. {props.get('name', 'Unnamed')}")
-            print(f"   Type: {props.get('highway', 'unknown')}")
-            print(f"   Points: {len(coords)}")
-            if coords:
-                print(f"   Start: {coords[0]}")
-                print(f"   End: {coords[-1]}")
+        data = _load_geojson(filepath)
+
+        if data.get('type') != 'FeatureCollection':
+            print("❌ Error: Not a valid FeatureCollection")
+            return
+
+        _print_summary(summarize_geojson(data))
 
         print("\n✅ GeoJSON file is valid")
 
     except FileNotFoundError:
         print(f"❌ Error: File not found: {filepath}")
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, gzip.BadGzipFile) as e:
         print(f"❌ Error: Invalid JSON: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -223,6 +627,15 @@ Examples:
   # Download roads near current location (smaller radius)
   python download_roads.py --lat 51.5074 --lon -0.1278 --radius 500
 
+  # Download roads along a route (one request for all waypoints)
+  python download_roads.py --points 37.7749,-122.4194 37.7790,-122.4150 --radius 300
+
+  # Save gzip-compressed output (roads.geojson.gz)
+  python download_roads.py --lat 51.5074 --lon -0.1278 --gzip
+
+  # Also export flat arrays for RoadFinder (loads faster than GeoJSON)
+  python download_roads.py --lat 51.5074 --lon -0.1278 --npz roads.npz
+
   # Validate existing GeoJSON file
   python download_roads.py --validate roads.geojson
         """
@@ -230,10 +643,18 @@ Examples:
 
     parser.add_argument('--lat', type=float, help='Center latitude')
     parser.add_argument('--lon', type=float, help='Center longitude')
+    parser.add_argument('--points', type=str, nargs='+', metavar='LAT,LON',
+                       help='Download around several points in one request')
     parser.add_argument('--radius', type=int, default=500,
                        help='Search radius in meters (default: 500)')
     parser.add_argument('--output', type=str, default='roads.geojson',
                        help='Output GeoJSON file (default: roads.geojson)')
+    parser.add_argument('--gzip', action='store_true',
+                       help='Compress the output (appends .gz to the file name)')
+    parser.add_argument('--npz', type=str, metavar='FILE',
+                       help='Also save roads as flat numpy arrays (.npz)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always download, ignoring cached results')
     parser.add_argument('--validate', type=str, metavar='FILE',
                        help='Validate existing GeoJSON file')
 
@@ -249,24 +670,43 @@ Examples:
         return
 
     # Download mode
-    if args.lat is None or args.lon is None:
-        print("\n❌ Error: --lat and --lon are required for download mode")
+    if args.points:
+        points = []
+        for text in args.points:
+            try:
+                lat, lon = (float(v) for v in text.split(','))
+            except ValueError:
+                print(f"❌ Error: Invalid point '{text}' (expected LAT,LON)")
+                sys.exit(1)
+            points.append((lat, lon))
+    elif args.lat is not None and args.lon is not None:
+        points = [(args.lat, args.lon)]
+    else:
+        print("\n❌ Error: --lat and --lon (or --points) are required for download mode")
         print("\nUse --help for usage information")
         sys.exit(1)
 
     # Validate coordinates
-    if not (-90 <= args.lat <= 90):
-        print(f"❌ Error: Invalid latitude {args.lat} (must be -90 to 90)")
-        sys.exit(1)
+    for lat, lon in points:
+        if not (-90 <= lat <= 90):
+            print(f"❌ Error: Invalid latitude {lat} (must be -90 to 90)")
+            sys.exit(1)
 
-    if not (-180 <= args.lon <= 180):
-        print(f"❌ Error: Invalid longitude {args.lon} (must be -180 to 180)")
-        sys.exit(1)
+        if not (-180 <= lon <= 180):
+            print(f"❌ Error: Invalid longitude {lon} (must be -180 to 180)")
+            sys.exit(1)
 
     if args.radius < 100 or args.radius > 5000:
         print(f"❌ Error: Radius {args.radius}m out of range (100-5000m)")
         sys.exit(1)
 
+    if args.npz and not NUMPY_AVAILABLE:
+        print("❌ Error: --npz requires numpy (pip install numpy)")
+        sys.exit(1)
+
+    if args.gzip and not args.output.endswith('.gz'):
+        args.output += '.gz'
+
     # Create output directory if needed
     output_dir = os.path.dirname(args.output)
     if output_dir and not os.path.exists(output_dir):
@@ -274,11 +714,16 @@ Examples:
         print(f"Created directory: {output_dir}")
 
     # Download roads
-    success = download_roads(args.lat, args.lon, args.radius, args.output)
+    if args.points:
+        summary = download_roads_multi(points, args.radius, args.output,
+                                       use_cache=not args.no_cache, npz_file=args.npz)
+    else:
+        summary = download_roads(args.lat, args.lon, args.radius, args.output,
+                                 use_cache=not args.no_cache, npz_file=args.npz)
 
-    if success:
-        # Validate the downloaded file
-        validate_geojson(args.output)
+    if summary is not None:
+        # Summarize what was just written - no need to re-read the file
+        _print_summary(summary)
         print("\n✅ Done!")
         sys.exit(0)
     else:
@@ -20,7 +20,12 @@ logger = get_logger(__name__)
 
 def clear_screen():
     """Clear terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+        return
+    # ANSI clear + cursor home - no subprocess per menu redraw
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
 def print_header(title):
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Numba-compiled versions of the scalar geo_utils hot paths.
+
+Imported by geo_utils when numba is installed; raises ImportError otherwise.
+Compiled code is cached next to this file, so only the first run pays the
+compile time, and every kernel is compiled at import so that cost is paid at
+startup rather than on the first call in the control loop.
+"""
+
+import math
+
+from numba import njit
+
+EARTH_RADIUS_METERS = 6371000.0  # Must match geo_utils.EARTH_RADIUS_METERS
+
+
+@njit(cache=True, fastmath=True)
+def haversine_distance(lat1, lon1, lat2, lon2):
+    """Compiled geo_utils.haversine_distance (meters)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2) - math.radians(lon1)
+
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_METERS * 2 * math.asin(math.sqrt(a))
+
+
+@njit(cache=True, fastmath=True)
+def calculate_bearing(lat1, lon1, lat2, lon2):
+    """Compiled geo_utils.calculate_bearing (degrees, 0-360)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlon = math.radians(lon2) - math.radians(lon1)
+
+    x = math.sin(dlon) * math.cos(lat2_rad)
+    y = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon)
+
+    return (math.degrees(math.atan2(x, y)) + 360) % 360
+
+
+@njit(cache=True, fastmath=True)
+def destination_point(lat, lon, bearing, distance):
+    """Compiled geo_utils.destination_point ((lat, lon) in degrees)"""
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    bearing_rad = math.radians(bearing)
+
+    angular_distance = distance / EARTH_RADIUS_METERS
+
+    dest_lat = math.asin(
+        math.sin(lat_rad) * math.cos(angular_distance) +
+        math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
+    )
+
+    dest_lon = lon_rad + math.atan2(
+        math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
+        math.cos(angular_distance) - math.sin(lat_rad) * math.sin(dest_lat)
+    )
+
+    return (math.degrees(dest_lat), math.degrees(dest_lon))
+
+
+def _warm_up():
+    """Compile (or load from cache) every kernel now rather than on first use mid-mission"""
+    haversine_distance(0.0, 0.0, 0.001, 0.001)
+    calculate_bearing(0.0, 0.0, 0.001, 0.001)
+    destination_point(0.0, 0.0, 90.0, 1.0)
+
+
+_warm_up()
@@ -6,11 +6,18 @@ Provides calculations for GPS coordinates, bearings, and distances.
 """
 
 import math
+from functools import lru_cache
 from typing import Tuple
 
+import numpy as np
+
 
 EARTH_RADIUS_METERS = 6371000.0  # Earth's radius in meters
 
+# Degree/radian factors - one multiply instead of a math.radians() call
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -25,20 +32,99 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in meters
     """
+    sin, cos = math.sin, math.cos
+
     # Convert to radians
-    lat1_rad, lon1_rad = math.radians(lat1), math.radians(lon1)
-    lat2_rad, lon2_rad = math.radians(lat2), math.radians(lon2)
+    lat1_rad = lat1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
 
     # Haversine formula
     dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
+    dlon = (lon2 - lon1) * _DEG2RAD
 
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    a = sin(dlat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2) ** 2
     c = 2 * math.asin(math.sqrt(a))
 
     return EARTH_RADIUS_METERS * c
 
 
+# Both coordinate deltas below this (degrees, ~1 km) use the flat-earth path
+FAST_DISTANCE_MAX_DEG = 0.01
+_METERS_PER_DEG = EARTH_RADIUS_METERS * _DEG2RAD
+
+
+def equirect_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Equirectangular (flat-earth) distance between two points.
+
+    One cos + one sqrt; sub-meter accurate for points within ~10 km of each
+    other but increasingly wrong beyond that - use haversine_distance for
+    long ranges.
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lon1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lon2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in meters
+    """
+    dx = (lon2 - lon1) * math.cos((lat1 + lat2) * 0.5 * _DEG2RAD) * _METERS_PER_DEG
+    dy = (lat2 - lat1) * _METERS_PER_DEG
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def haversine_distance_fast(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Distance between two points, using an equirectangular approximation
+    when they are close together.
+
+    Sub-meter accurate at this range and needs one cos + one sqrt instead of
+    the full haversine. Falls back to haversine_distance for distant points.
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lon1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lon2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in meters
+    """
+    if abs(lat2 - lat1) < FAST_DISTANCE_MAX_DEG and abs(lon2 - lon1) < FAST_DISTANCE_MAX_DEG:
+        return equirect_distance(lat1, lon1, lat2, lon2)
+
+    return haversine_distance(lat1, lon1, lat2, lon2)
+
+
+def haversine_distance_batch(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Vectorized haversine_distance over arrays of points.
+
+    Arguments broadcast against each other, so one point can be compared
+    against many in a single call (e.g. every vertex of a road).
+
+    Args:
+        lat1: Latitude(s) of first point(s) (degrees)
+        lon1: Longitude(s) of first point(s) (degrees)
+        lat2: Latitude(s) of second point(s) (degrees)
+        lon2: Longitude(s) of second point(s) (degrees)
+
+    Returns:
+        Array of distances in meters
+    """
+    # Convert to radians
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(lon2) - np.radians(lon1)
+
+    # Haversine formula
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_METERS * 2 * np.arcsin(np.sqrt(a))
+
+
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the initial bearing from point 1 to point 2.
@@ -52,16 +138,19 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     Returns:
         Bearing in degrees (0-360, where 0 is North, 90 is East)
     """
+    sin, cos = math.sin, math.cos
+
     # Convert to radians
-    lat1_rad, lon1_rad = math.radians(lat1), math.radians(lon1)
-    lat2_rad, lon2_rad = math.radians(lat2), math.radians(lon2)
+    lat1_rad = lat1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
 
-    dlon = lon2_rad - lon1_rad
+    dlon = (lon2 - lon1) * _DEG2RAD
 
-    x = math.sin(dlon) * math.cos(lat2_rad)
-    y = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon)
+    cos_lat2 = cos(lat2_rad)
+    x = sin(dlon) * cos_lat2
+    y = cos(lat1_rad) * sin(lat2_rad) - sin(lat1_rad) * cos_lat2 * cos(dlon)
 
-    bearing = math.degrees(math.atan2(x, y))
+    bearing = math.atan2(x, y) * _RAD2DEG
 
     return normalize_bearing(bearing)
 
@@ -130,23 +219,28 @@ def project_point_onto_line(point: Tuple[float, float],
     Returns:
         (lat, lon) of closest point on line segment
     """
+    sin, cos = math.sin, math.cos
+
     # Convert to radians
-    lat_p, lon_p = math.radians(point[0]), math.radians(point[1])
-    lat_a, lon_a = math.radians(line_start[0]), math.radians(line_start[1])
-    lat_b, lon_b = math.radians(line_end[0]), math.radians(line_end[1])
+    lat_p, lon_p = point[0] * _DEG2RAD, point[1] * _DEG2RAD
+    lat_a, lon_a = line_start[0] * _DEG2RAD, line_start[1] * _DEG2RAD
+    lat_b, lon_b = line_end[0] * _DEG2RAD, line_end[1] * _DEG2RAD
 
     # Calculate vectors
-    ax = math.cos(lat_a) * math.cos(lon_a)
-    ay = math.cos(lat_a) * math.sin(lon_a)
-    az = math.sin(lat_a)
+    cos_lat_a = cos(lat_a)
+    ax = cos_lat_a * cos(lon_a)
+    ay = cos_lat_a * sin(lon_a)
+    az = sin(lat_a)
 
-    bx = math.cos(lat_b) * math.cos(lon_b)
-    by = math.cos(lat_b) * math.sin(lon_b)
-    bz = math.sin(lat_b)
+    cos_lat_b = cos(lat_b)
+    bx = cos_lat_b * cos(lon_b)
+    by = cos_lat_b * sin(lon_b)
+    bz = sin(lat_b)
 
-    px = math.cos(lat_p) * math.cos(lon_p)
-    py = math.cos(lat_p) * math.sin(lon_p)
-    pz = math.sin(lat_p)
+    cos_lat_p = cos(lat_p)
+    px = cos_lat_p * cos(lon_p)
+    py = cos_lat_p * sin(lon_p)
+    pz = sin(lat_p)
 
     # Calculate projection parameter t
     abx, aby, abz = bx - ax, by - ay, bz - az
@@ -172,7 +266,65 @@ def project_point_onto_line(point: Tuple[float, float],
     lat_q = math.atan2(qz, math.sqrt(qx * qx + qy * qy))
     lon_q = math.atan2(qy, qx)
 
-    return (math.degrees(lat_q), math.degrees(lon_q))
+    return (lat_q * _RAD2DEG, lon_q * _RAD2DEG)
+
+
+def project_point_onto_segments(point: Tuple[float, float], segments) -> np.ndarray:
+    """
+    Vectorized project_point_onto_line over many line segments.
+
+    Args:
+        point: (lat, lon) of the point
+        segments: Array of shape (N, 2, 2) - [start, end] (lat, lon) pairs per segment
+
+    Returns:
+        Array of shape (N, 2) with the (lat, lon) of the closest point on each segment
+    """
+    segments_deg = np.asarray(segments, dtype=np.float64)
+    segments_rad = np.radians(segments_deg)
+    lats = segments_rad[..., 0]
+    lons = segments_rad[..., 1]
+
+    # Unit vectors for every segment endpoint - shape (N, 2, 3)
+    cos_lats = np.cos(lats)
+    xyz = np.stack((cos_lats * np.cos(lons), cos_lats * np.sin(lons), np.sin(lats)), axis=-1)
+    a = xyz[:, 0]
+    b = xyz[:, 1]
+
+    lat_p, lon_p = math.radians(point[0]), math.radians(point[1])
+    cos_lat_p = math.cos(lat_p)
+    p = np.array([cos_lat_p * math.cos(lon_p), cos_lat_p * math.sin(lon_p), math.sin(lat_p)])
+
+    # Calculate projection parameter t for every segment, clamped to stay on segment
+    ab = b - a
+    ap = p - a
+    ab_dot_ab = np.einsum('ij,ij->i', ab, ab)
+    ap_dot_ab = np.einsum('ij,ij->i', ap, ab)
+    degenerate = ab_dot_ab == 0
+    t = np.clip(ap_dot_ab / np.where(degenerate, 1.0, ab_dot_ab), 0.0, 1.0)
+
+    # Calculate projected points and convert back to lat/lon
+    q = a + t[:, None] * ab
+    lat_q = np.arctan2(q[:, 2], np.hypot(q[:, 0], q[:, 1]))
+    lon_q = np.arctan2(q[:, 1], q[:, 0])
+    projected = np.degrees(np.stack((lat_q, lon_q), axis=-1))
+
+    # Zero-length segments project onto their start, as in project_point_onto_line
+    projected[degenerate] = segments_deg[degenerate, 0]
+
+    return projected
+
+
+@lru_cache(maxsize=1024)
+def _trig_lat(lat_deg: float) -> Tuple[float, float]:
+    """
+    (sin, cos) of a latitude, cached for repeated start points.
+
+    Only the pure-Python destination_point uses this; with numba installed
+    the compiled version replaces it and computes the trig directly.
+    """
+    lat_rad = lat_deg * _DEG2RAD
+    return (math.sin(lat_rad), math.cos(lat_rad))
 
 
 def destination_point(lat: float, lon: float, bearing: float, distance: float) -> Tuple[float, float]:
@@ -188,20 +340,63 @@ def destination_point(lat: float, lon: float, bearing: float, distance: float) -
     Returns:
         (lat, lon) of destination point
     """
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
-    bearing_rad = math.radians(bearing)
+    sin, cos = math.sin, math.cos
+
+    lon_rad = lon * _DEG2RAD
+    bearing_rad = bearing * _DEG2RAD
 
     angular_distance = distance / EARTH_RADIUS_METERS
+    sin_lat, cos_lat = _trig_lat(lat)
+    sin_ad, cos_ad = sin(angular_distance), cos(angular_distance)
 
-    dest_lat = math.asin(
-        math.sin(lat_rad) * math.cos(angular_distance) +
-        math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
-    )
+    dest_lat = math.asin(sin_lat * cos_ad + cos_lat * sin_ad * cos(bearing_rad))
 
     dest_lon = lon_rad + math.atan2(
-        math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-        math.cos(angular_distance) - math.sin(lat_rad) * math.sin(dest_lat)
+        sin(bearing_rad) * sin_ad * cos_lat,
+        cos_ad - sin_lat * sin(dest_lat)
+    )
+
+    return (dest_lat * _RAD2DEG, dest_lon * _RAD2DEG)
+
+
+def destination_point_batch(lat, lon, bearing, distance) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized destination_point over arrays of start points/bearings/distances.
+
+    Arguments broadcast against each other.
+
+    Args:
+        lat: Starting latitude(s) (degrees)
+        lon: Starting longitude(s) (degrees)
+        bearing: Bearing(s) in degrees (0-360)
+        distance: Distance(s) in meters
+
+    Returns:
+        (lats, lons) arrays of destination points (degrees)
+    """
+    lat_rad = np.radians(lat)
+    lon_rad = np.radians(lon)
+    bearing_rad = np.radians(bearing)
+
+    angular_distance = np.asarray(distance, dtype=np.float64) / EARTH_RADIUS_METERS
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    sin_ad, cos_ad = np.sin(angular_distance), np.cos(angular_distance)
+
+    dest_lat = np.arcsin(sin_lat * cos_ad + cos_lat * sin_ad * np.cos(bearing_rad))
+
+    dest_lon = lon_rad + np.arctan2(
+        np.sin(bearing_rad) * sin_ad * cos_lat,
+        cos_ad - sin_lat * np.sin(dest_lat)
     )
 
-    return (math.degrees(dest_lat), math.degrees(dest_lon))
+    return (np.degrees(dest_lat), np.degrees(dest_lon))
+
+
+# Use native-compiled versions of the per-sample scalar functions when numba
+# is installed (pure-Python definitions above remain the fallback). The
+# compiled destination_point does not use the _trig_lat cache.
+try:
+    from utils._geo_njit import haversine_distance, calculate_bearing, destination_point
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
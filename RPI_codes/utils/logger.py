@@ -3,12 +3,36 @@
 """
 Logging utilities for robot controller.
 Provides console and file logging with proper formatting.
+
+Records are handed to a background listener thread through a queue, so
+logging from the control loops never blocks on console or disk writes.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
+# Background thread draining the log queue into the real handlers
+_listener = None
+
+# File logging: records buffered per batch, ERROR and above flush at once
+LOG_BUFFER_RECORDS = 1024
+LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per file
+LOG_BACKUP_COUNT = 5
+
+
+def _stop_listener():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
 
 def setup_logging(log_file=None, log_level='INFO'):
     """
@@ -21,6 +45,14 @@ def setup_logging(log_file=None, log_level='INFO'):
     Returns:
         logging.Logger: Root logger instance
     """
+    global _listener
+
+    # Skip per-record thread/process/caller lookups - none are in the format
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # Convert string level to logging constant
     level = getattr(logging, log_level.upper(), logging.INFO)
 
@@ -34,28 +66,50 @@ def setup_logging(log_file=None, log_level='INFO'):
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Remove existing handlers
+    # Remove existing handlers (and the listener feeding them)
+    _stop_listener()
     root_logger.handlers.clear()
+    handlers = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (if specified)
+    file_error = None
     if log_file:
         try:
             # Create log directory if it doesn't exist
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(level)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding='utf-8'
+            )
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+
+            # Coalesce records into one write per batch
+            buffered_handler = logging.handlers.MemoryHandler(
+                LOG_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler
+            )
+            buffered_handler.setLevel(level)
+            handlers.append(buffered_handler)
         except Exception as e:
-            root_logger.warning(f"Could not create file logger: {e}")
+            file_error = e
+
+    # Producers only enqueue; the listener thread does the actual I/O
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if file_error:
+        root_logger.warning(f"Could not create file logger: {file_error}")
 
     root_logger.info("=" * 60)
     root_logger.info("Logging system initialized")
@@ -67,6 +121,9 @@ def setup_logging(log_file=None, log_level='INFO'):
     return root_logger
 
 
+atexit.register(_stop_listener)
+
+
 def get_logger(name):
     """
     Get a logger for a specific module.
@@ -6,8 +6,16 @@ Functions for road alignment, positioning, and painting calculations.
 """
 
 import math
-from typing import Tuple
-from utils.geo_utils import destination_point, normalize_bearing, bearing_difference
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+import numpy as np
+from utils.geo_utils import (destination_point, destination_point_batch,
+                             haversine_distance, equirect_distance)
+
+# Bearing arithmetic below is written inline ((x + 180) % 360 - 180 for
+# bearing_difference, x % 360 for normalize_bearing) rather than calling the
+# geo_utils helpers - these functions run per control-loop tick and the
+# call overhead outweighs the math.
 
 
 def calculate_perpendicular_position(road_bearing: float,
@@ -27,11 +35,34 @@ def calculate_perpendicular_position(road_bearing: float,
         (lat, lon) of perpendicular position
     """
     # Perpendicular bearing is 90 degrees from road bearing
-    perp_bearing = normalize_bearing(road_bearing + 90)
+    perp_bearing = (road_bearing + 90.0) % 360.0
 
     return destination_point(current_lat, current_lon, perp_bearing, abs(distance_from_road))
 
 
+def calculate_perpendicular_position_batch(road_bearings, current_lats, current_lons,
+                                           distances_from_road) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_perpendicular_position over many points.
+
+    Arguments broadcast against each other (e.g. one road bearing for
+    every point along a segment).
+
+    Args:
+        road_bearings: Bearing(s) of the road (degrees)
+        current_lats: Latitude(s)
+        current_lons: Longitude(s)
+        distances_from_road: Distance(s) to move perpendicular (meters)
+
+    Returns:
+        (lats, lons) arrays of perpendicular positions
+    """
+    perp_bearings = np.mod(np.asarray(road_bearings, dtype=np.float64) + 90.0, 360.0)
+
+    return destination_point_batch(current_lats, current_lons, perp_bearings,
+                                   np.abs(distances_from_road))
+
+
 def calculate_stencil_angle(road_bearing: float, robot_heading: float) -> float:
     """
     Calculate servo angle needed to align stencil with road.
@@ -41,16 +72,51 @@ def calculate_stencil_angle(road_bearing: float, robot_heading: float) -> float:
         robot_heading: Current heading of robot (degrees, 0-360)
 
     Returns:
-        Servo angle in degrees (0-180, where 90 is center)
+        Servo angle in degrees (0-180, where 90 is center), to the nearest degree
     """
-    # Calculate angle difference
-    angle_diff = bearing_difference(robot_heading, road_bearing)
+    # Calculate angle difference (bearing_difference, inline). Wrapping
+    # before rounding keeps the +/-180 boundary where bearing_difference has it.
+    angle_diff = (road_bearing - robot_heading + 180.0) % 360.0 - 180.0
 
     # Convert to servo angle (90 is center, 0 is full left, 180 is full right)
-    servo_angle = 90 + angle_diff
+    servo_angle = 90.0 + angle_diff
+
+    # Clamp to valid servo range - in range is the common case, so test that
+    # first instead of paying for two builtin calls. The servo only resolves
+    # ~1 degree, so in-range angles are rounded to whole degrees.
+    if 0.0 <= servo_angle <= 180.0:
+        return float(round(servo_angle))
+    # Out of range - or NaN from a non-finite heading, which fails both
+    # comparisons and lands on 180 like the old max/min clamp did
+    return 0.0 if servo_angle < 0.0 else 180.0
+
+
+def calculate_stencil_angle_batch(road_bearings, robot_headings) -> np.ndarray:
+    """
+    Vectorized calculate_stencil_angle over many bearing/heading pairs.
+
+    Uses the same rule as the scalar version: wrap, round to whole degrees,
+    clamp, and 180 for non-finite inputs. Computed in float32, so a value
+    sitting exactly on a half-degree can round differently.
+
+    Args:
+        road_bearings: Bearing(s) of the road (degrees, 0-360)
+        robot_headings: Heading(s) of robot (degrees, 0-360)
+
+    Returns:
+        float32 array of servo angles in degrees (0-180, where 90 is center)
+    """
+    # float32 is far finer than the servo's ~0.5 degree resolution and halves
+    # the memory traffic of the ufunc chain
+    road_bearings = np.asarray(road_bearings, dtype=np.float32)
+    robot_headings = np.asarray(robot_headings, dtype=np.float32)
+
+    angle_diff = np.mod(road_bearings - robot_headings + np.float32(180.0), np.float32(360.0)) - np.float32(180.0)
 
-    # Clamp to valid servo range
-    return max(0, min(180, servo_angle))
+    servo_angles = np.clip(np.rint(np.float32(90.0) + angle_diff), np.float32(0.0), np.float32(180.0))
+
+    # NaN passes through np.clip; the scalar version returns 180 for it
+    return np.where(np.isnan(servo_angles), np.float32(180.0), servo_angles)
 
 
 def is_aligned_with_road(road_bearing: float, robot_heading: float,
@@ -66,10 +132,35 @@ def is_aligned_with_road(road_bearing: float, robot_heading: float,
     Returns:
         True if aligned within tolerance
     """
-    angle_diff = abs(bearing_difference(robot_heading, road_bearing))
+    # Usually already aligned with no wrap-around involved - plain comparison
+    raw_diff = road_bearing - robot_heading
+    if -tolerance_degrees <= raw_diff <= tolerance_degrees:
+        return True
+
+    angle_diff = abs((raw_diff + 180.0) % 360.0 - 180.0)
     return angle_diff <= tolerance_degrees
 
 
+def is_aligned_with_road_batch(road_bearings, robot_headings,
+                              tolerance_degrees: float = 5.0) -> np.ndarray:
+    """
+    Vectorized is_aligned_with_road, e.g. for a track of IMU headings.
+
+    Arguments broadcast, so one road bearing can be checked against many
+    headings.
+
+    Args:
+        road_bearings: Bearing(s) of the road (degrees)
+        robot_headings: Heading(s) of robot (degrees)
+        tolerance_degrees: Acceptable alignment error (degrees)
+
+    Returns:
+        Boolean array, True where aligned within tolerance
+    """
+    angle_diff = np.mod(np.asarray(road_bearings, dtype=np.float64) - robot_headings + 180.0, 360.0) - 180.0
+    return np.abs(angle_diff) <= tolerance_degrees
+
+
 def calculate_approach_angle(road_bearing: float, approach_bearing: float) -> float:
     """
     Calculate turn angle needed to approach road perpendicularly.
@@ -81,10 +172,23 @@ def calculate_approach_angle(road_bearing: float, approach_bearing: float) -> fl
     Returns:
         Turn angle needed (degrees, positive = turn right, negative = turn left)
     """
-    # Perpendicular approach is 90 degrees from road
-    target_bearing = normalize_bearing(road_bearing + 90)
+    # Perpendicular approach is 90 degrees from road:
+    # bearing_difference(approach, road + 90) folded into one modulo
+    return (road_bearing - approach_bearing + 270.0) % 360.0 - 180.0
 
-    return bearing_difference(approach_bearing, target_bearing)
+
+def calculate_approach_angle_batch(road_bearings, approach_bearings) -> np.ndarray:
+    """
+    Vectorized calculate_approach_angle over many bearings.
+
+    Args:
+        road_bearings: Bearing(s) of the road (degrees)
+        approach_bearings: Current approach bearing(s) (degrees)
+
+    Returns:
+        Array of turn angles (degrees, positive = turn right, negative = turn left)
+    """
+    return np.mod(np.asarray(road_bearings, dtype=np.float64) - approach_bearings + 270.0, 360.0) - 180.0
 
 
 def calculate_painting_position(road_lat: float,
@@ -103,13 +207,26 @@ def calculate_painting_position(road_lat: float,
     Returns:
         (lat, lon) of optimal painting position
     """
-    # Position robot perpendicular to road at specified offset
-    return calculate_perpendicular_position(
-        road_bearing,
-        road_lat,
-        road_lon,
-        offset_meters
-    )
+    # Position robot perpendicular to road at specified offset (same as
+    # calculate_perpendicular_position, inlined - called once per painting point)
+    return destination_point(road_lat, road_lon, (road_bearing + 90.0) % 360.0, abs(offset_meters))
+
+
+def calculate_painting_position_batch(road_lats, road_lons, road_bearings,
+                                      offset_meters=1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_painting_position over many road points.
+
+    Args:
+        road_lats: Latitude(s) of points on road
+        road_lons: Longitude(s) of points on road
+        road_bearings: Bearing(s) of the road
+        offset_meters: Distance(s) from road (meters)
+
+    Returns:
+        (lats, lons) arrays of painting positions
+    """
+    return calculate_perpendicular_position_batch(road_bearings, road_lats, road_lons, offset_meters)
 
 
 def is_position_safe_for_painting(lat: float,
@@ -117,7 +234,8 @@ def is_position_safe_for_painting(lat: float,
                                   road_lat: float,
                                   road_lon: float,
                                   min_distance: float = 0.5,
-                                  max_distance: float = 2.0) -> Tuple[bool, str]:
+                                  max_distance: float = 2.0,
+                                  precise: bool = False) -> Tuple[bool, str]:
     """
     Check if current position is safe for painting operation.
 
@@ -128,13 +246,16 @@ def is_position_safe_for_painting(lat: float,
         road_lon: Target road longitude
         min_distance: Minimum safe distance (meters)
         max_distance: Maximum effective distance (meters)
+        precise: Use the full haversine formula instead of the flat-earth
+                 approximation (only matters far beyond painting range)
 
     Returns:
         (is_safe, reason) tuple
     """
-    from utils.geo_utils import haversine_distance
-
-    distance = haversine_distance(lat, lon, road_lat, road_lon)
+    if precise:
+        distance = haversine_distance(lat, lon, road_lat, road_lon)
+    else:
+        distance = equirect_distance(lat, lon, road_lat, road_lon)
 
     if distance < min_distance:
         return (False, f"Too close to road: {distance:.2f}m (min: {min_distance}m)")
@@ -155,4 +276,84 @@ def calculate_road_perpendicular_bearing(road_bearing: float) -> float:
     Returns:
         Perpendicular bearing (degrees, 90 degrees clockwise from road)
     """
-    return normalize_bearing(road_bearing + 90)
+    return (road_bearing + 90.0) % 360.0
+
+
+@dataclass
+class WaypointBuffer:
+    """
+    Painting waypoints as parallel arrays (one contiguous float64 array per
+    field) for the *_batch functions, instead of a list of tuples.
+    """
+    lats: np.ndarray  # Latitudes (degrees)
+    lons: np.ndarray  # Longitudes (degrees)
+    bearings: np.ndarray  # Road bearing at each waypoint (degrees)
+
+    def __post_init__(self):
+        self.lats = np.ascontiguousarray(self.lats, dtype=np.float64)
+        self.lons = np.ascontiguousarray(self.lons, dtype=np.float64)
+        self.bearings = np.ascontiguousarray(self.bearings, dtype=np.float64)
+
+    @classmethod
+    def from_tuples(cls, points: Iterable[Tuple[float, float, float]]) -> 'WaypointBuffer':
+        """
+        Build from (lat, lon, bearing) tuples with a single array conversion.
+
+        Args:
+            points: (lat, lon, bearing) tuples
+
+        Returns:
+            WaypointBuffer
+        """
+        columns = np.array(list(points), dtype=np.float64).reshape(-1, 3).T
+        return cls(columns[0], columns[1], columns[2])
+
+    def __len__(self):
+        return len(self.lats)
+
+    def painting_positions(self, offset_meters=1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """calculate_painting_position_batch for every waypoint"""
+        return calculate_painting_position_batch(self.lats, self.lons, self.bearings, offset_meters)
+
+    def stencil_angles(self, robot_headings) -> np.ndarray:
+        """calculate_stencil_angle_batch for every waypoint"""
+        return calculate_stencil_angle_batch(self.bearings, robot_headings)
+
+
+class RoadBearing:
+    """
+    A road's bearing with its perpendicular precomputed, for painting many
+    points along the same road segment.
+
+    The methods match the module functions of the same name but skip
+    recomputing the perpendicular bearing on every call. (Named to avoid
+    confusion with navigation.road_finder.RoadSegment.)
+    """
+
+    __slots__ = ('bearing', 'perp_bearing')
+
+    def __init__(self, bearing: float):
+        """
+        Args:
+            bearing: Bearing of the road (degrees)
+        """
+        self.bearing = bearing
+        self.perp_bearing = (bearing + 90.0) % 360.0
+
+    def perpendicular_position(self, current_lat: float, current_lon: float,
+                               distance_from_road: float) -> Tuple[float, float]:
+        """See calculate_perpendicular_position"""
+        return destination_point(current_lat, current_lon, self.perp_bearing, abs(distance_from_road))
+
+    def painting_position(self, road_lat: float, road_lon: float,
+                          offset_meters: float = 1.0) -> Tuple[float, float]:
+        """See calculate_painting_position"""
+        return destination_point(road_lat, road_lon, self.perp_bearing, abs(offset_meters))
+
+    def approach_angle(self, approach_bearing: float) -> float:
+        """See calculate_approach_angle"""
+        return (self.perp_bearing - approach_bearing + 180.0) % 360.0 - 180.0
+
+    def perpendicular_bearing(self) -> float:
+        """See calculate_road_perpendicular_bearing"""
+        return self.perp_bearing
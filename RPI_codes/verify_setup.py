@@ -5,8 +5,18 @@ Setup Verification Script
 Verifies that the robot controller is properly configured and all dependencies are available.
 """
 
+import importlib.util
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Load the configuration once; checks that need it report the import error
+try:
+    from config import Config
+    _CONFIG_ERR = None
+except Exception as e:
+    Config = None
+    _CONFIG_ERR = e
 
 
 def print_header(title):
@@ -45,8 +55,10 @@ def check_serial_port():
     Returns:
         (success, message) tuple
     """
+    if _CONFIG_ERR:
+        return (False, f"Error checking serial port: {_CONFIG_ERR}")
+
     try:
-        from config import Config
         serial_port = Config.MTI_SERIAL_PORT
 
         if os.path.exists(serial_port):
@@ -77,10 +89,12 @@ def check_dependencies():
 
     missing = []
 
+    # Only locate the modules - importing them would run their top-level code
     for module_name, package_name in required_modules:
         try:
-            __import__(module_name)
-        except ImportError:
+            if importlib.util.find_spec(module_name) is None:
+                missing.append(package_name)
+        except ModuleNotFoundError:  # Parent package (e.g. paho) missing
             missing.append(package_name)
 
     if missing:
@@ -96,8 +110,10 @@ def check_configuration():
     Returns:
         (success, message) tuple
     """
+    if _CONFIG_ERR:
+        return (False, f"Error loading configuration: {_CONFIG_ERR}")
+
     try:
-        from config import Config
         Config.validate()
         return (True, "Configuration valid")
     except ValueError as e:
@@ -113,8 +129,10 @@ def check_geojson_file():
     Returns:
         (success, message) tuple
     """
+    if _CONFIG_ERR:
+        return (False, f"Error checking GeoJSON file: {_CONFIG_ERR}")
+
     try:
-        from config import Config
         geojson_file = Config.GEOJSON_ROADS_FILE
 
         if os.path.exists(geojson_file):
@@ -146,8 +164,10 @@ def check_log_directory():
     Returns:
         (success, message) tuple
     """
+    if _CONFIG_ERR:
+        return (False, f"Error checking log directory: {_CONFIG_ERR}")
+
     try:
-        from config import Config
         log_file = Config.LOG_FILE
         log_dir = os.path.dirname(log_file)
 
@@ -186,13 +206,30 @@ def run_checks():
 
     results = []
 
-    for check_name, check_func in checks:
-        success, message = check_func()
+    def report(check_name, success, message):
         results.append((check_name, success, message))
-
         status = "✅" if success else "❌"
         print(f"{status} {check_name}: {message}")
 
+    # The remaining checks are independent and mostly wait on imports and
+    # the filesystem, so run them concurrently and report as they finish.
+    # GPIO setup is not thread-safe - that one runs here on the main thread.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {
+            executor.submit(check_func): check_name
+            for check_name, check_func in checks
+            if check_func is not check_hardware
+        }
+
+        report("Hardware (GPIO)", *check_hardware())
+
+        for future in as_completed(futures):
+            report(futures[future], *future.result())
+
+    # Back to the declared order
+    order = [check_name for check_name, _ in checks]
+    results.sort(key=lambda result: order.index(result[0]))
+
     print("\n" + "=" * 60)
 
     all_passed = all(result[1] for result in results)
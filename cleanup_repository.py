@@ -14,18 +14,44 @@ Author: GIQ 2025 Team
 """
 
 import os
+import sys
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Parallel rmtree workers - deletion is dominated by unlink syscalls
+PYCACHE_WORKERS = 8
+
+# Action log lines written per batch (printing line by line is slow on the
+# Pi's serial console)
+LOG_FLUSH_EVERY = 64
+
+
+def _find_pycache(root):
+    """Yield every __pycache__ directory under root (symlinks not followed)"""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name == "__pycache__":
+                yield entry.path
+            else:
+                yield from _find_pycache(entry.path)
+
 
 class RepositoryCleanup:
     """Clean up repository - delete redundant files, archive experimental code"""
 
     def __init__(self, repo_root, dry_run=True):
-        self.repo_root = Path(repo_root)
+        self.repo_root = str(repo_root)  # Plain str - os.path is cheaper than pathlib per file
         self.dry_run = dry_run
         self.changes = []
+        self._log_buffer = bytearray()
+        self._log_pending = 0
 
     def log_action(self, action, path, reason=""):
         """Log a cleanup action"""
@@ -33,37 +59,51 @@ class RepositoryCleanup:
         if reason:
             msg += f" - {reason}"
         self.changes.append(msg)
-        print(msg)
+
+        self._log_buffer += (msg + "\n").encode()
+        self._log_pending += 1
+        if self._log_pending >= LOG_FLUSH_EVERY:
+            self.flush_log()
+
+    def flush_log(self):
+        """Write out buffered action log lines"""
+        if not self._log_buffer:
+            return
+        sys.stdout.flush()  # Keep ordering with anything print()ed before
+        sys.stdout.buffer.write(self._log_buffer)
+        sys.stdout.buffer.flush()
+        self._log_buffer.clear()
+        self._log_pending = 0
 
     def delete_file(self, filepath, reason=""):
         """Delete a redundant file"""
-        full_path = self.repo_root / filepath
+        full_path = os.path.join(self.repo_root, filepath)
 
-        if not full_path.exists():
+        if not os.path.exists(full_path):
             self.log_action("SKIP", filepath, "File does not exist")
             return
 
         if self.dry_run:
             self.log_action("DRY-RUN DELETE", filepath, reason)
         else:
-            full_path.unlink()
+            os.unlink(full_path)
             self.log_action("DELETED", filepath, reason)
 
     def archive_file(self, filepath, archive_dir, reason=""):
         """Move experimental file to archive directory"""
-        source = self.repo_root / filepath
-        dest_dir = self.repo_root / archive_dir
-        dest = dest_dir / source.name
+        source = os.path.join(self.repo_root, filepath)
+        dest_dir = os.path.join(self.repo_root, archive_dir)
+        dest = os.path.join(dest_dir, os.path.basename(source))
 
-        if not source.exists():
+        if not os.path.exists(source):
             self.log_action("SKIP", filepath, "File does not exist")
             return
 
         if self.dry_run:
             self.log_action("DRY-RUN ARCHIVE", f"{filepath} → {archive_dir}", reason)
         else:
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(source), str(dest))
+            os.makedirs(dest_dir, exist_ok=True)
+            shutil.move(source, dest)
             self.log_action("ARCHIVED", f"{filepath} → {dest}", reason)
 
     def delete_pycache(self):
@@ -72,11 +112,15 @@ class RepositoryCleanup:
         print("Cleaning Python cache directories...")
         print("="*70)
 
-        for pycache in self.repo_root.rglob("__pycache__"):
-            if self.dry_run:
+        pycache_dirs = list(_find_pycache(self.repo_root))
+
+        if self.dry_run:
+            for pycache in pycache_dirs:
                 self.log_action("DRY-RUN DELETE", pycache, "Python cache")
-            else:
-                shutil.rmtree(pycache)
+            return
+
+        with ThreadPoolExecutor(max_workers=PYCACHE_WORKERS) as executor:
+            for pycache, _ in zip(pycache_dirs, executor.map(shutil.rmtree, pycache_dirs)):
                 self.log_action("DELETED", pycache, "Python cache")
 
     def cleanup_redundant_files(self):
@@ -119,7 +163,7 @@ class RepositoryCleanup:
 
     def create_readme_in_archive(self):
         """Create README in experimental archive"""
-        archive_dir = self.repo_root / "RPI_codes/cam/experimental"
+        archive_dir = Path(self.repo_root) / "RPI_codes/cam/experimental"
 
         if self.dry_run:
             self.log_action("DRY-RUN CREATE", "experimental/README.md", "Archive documentation")
@@ -212,11 +256,13 @@ configuration requirements than the production system.
 
         print(f"Repository: {self.repo_root}")
 
-        # Execute cleanup steps
-        self.delete_pycache()
-        self.cleanup_redundant_files()
-        self.archive_experimental_files()
-        self.create_readme_in_archive()
+        # Execute cleanup steps (flushing the action log after each one)
+        for step in (self.delete_pycache,
+                     self.cleanup_redundant_files,
+                     self.archive_experimental_files,
+                     self.create_readme_in_archive):
+            step()
+            self.flush_log()
 
         # Summary
         self.generate_summary()